@@ -5,6 +5,11 @@ from typing import Any, List, Optional
 
 PY38 = sys.version_info >= (3, 8)
 
+if PY38:
+    from typing import Literal  # noqa: F401
+else:
+    from typing_extensions import Literal  # noqa: F401
+
 
 def decode(string: Any, encodings: Optional[List[str]] = None):
     if not isinstance(string, bytes):
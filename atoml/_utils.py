@@ -2,7 +2,7 @@ import re
 
 from collections.abc import Mapping
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Union
+from typing import Any, Union
 
 from ._compat import decode
 
@@ -125,12 +125,35 @@ def escape_string(s: str) -> str:
     return "".join(res)
 
 
-def merge_dicts(d1: dict, d2: dict) -> dict:
+def merged_dicts(d1: dict, d2: dict) -> dict:
+    """
+    Returns the result of merging d2 into d1 without modifying either of them.
+    Only the dictionaries along the merged keys are copied.
+    """
+    merged = dict(d1)
     for k, v in d2.items():
-        if k in d1 and isinstance(d1[k], dict) and isinstance(v, Mapping):
-            merge_dicts(d1[k], v)
+        if k in merged and isinstance(merged[k], dict) and isinstance(v, Mapping):
+            merged[k] = merged_dicts(merged[k], v)
         else:
-            d1[k] = d2[k]
+            merged[k] = v
+
+    return merged
+
+
+def copied_dicts(d: dict) -> dict:
+    """
+    Returns a copy of d and of the plain dictionaries and lists nested in it.
+    """
+    return {k: _copied_value(v) for k, v in d.items()}
+
+
+def _copied_value(v: Any) -> Any:
+    if type(v) is dict:
+        return copied_dicts(v)
+    elif type(v) is list:
+        return [_copied_value(e) for e in v]
+
+    return v
 
 
 def escape_quotes(s: str, quote: str) -> str:
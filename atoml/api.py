@@ -1,10 +1,12 @@
 import datetime as _datetime
 
 from collections.abc import Mapping
-from typing import IO, Tuple
+from typing import IO, Any, Dict, Tuple, Union, overload
 
+from ._compat import Literal
 from ._utils import parse_rfc3339
 from .container import Container
+from .exceptions import ParseError
 from .items import (
     AoT,
     Array,
@@ -22,13 +24,34 @@ from .parser import Parser
 from .toml_document import TOMLDocument
 
 
-def loads(string: str) -> TOMLDocument:
+@overload
+def loads(
+    string: str, *, preserve: Literal[True] = ..., lazy: bool = ...
+) -> TOMLDocument:
+    ...
+
+
+@overload
+def loads(string: str, *, preserve: Literal[False], lazy: bool = ...) -> Dict[str, Any]:
+    ...
+
+
+@overload
+def loads(
+    string: str, *, preserve: bool = ..., lazy: bool = ...
+) -> Union[TOMLDocument, Dict[str, Any]]:
+    ...
+
+
+def loads(
+    string: str, *, preserve: bool = True, lazy: bool = False
+) -> Union[TOMLDocument, Dict[str, Any]]:
     """
     Parses a string into a TOMLDocument.
 
     Alias for parse().
     """
-    return parse(string)
+    return parse(string, preserve=preserve, lazy=lazy)
 
 
 def dumps(data: Mapping, sort_keys: bool = False) -> str:
@@ -47,25 +70,90 @@ def dumps(data: Mapping, sort_keys: bool = False) -> str:
         raise TypeError(msg) from ex
 
 
-def load(fp: IO) -> TOMLDocument:
+@overload
+def load(fp: IO, *, preserve: Literal[True] = ..., lazy: bool = ...) -> TOMLDocument:
+    ...
+
+
+@overload
+def load(fp: IO, *, preserve: Literal[False], lazy: bool = ...) -> Dict[str, Any]:
+    ...
+
+
+@overload
+def load(
+    fp: IO, *, preserve: bool = ..., lazy: bool = ...
+) -> Union[TOMLDocument, Dict[str, Any]]:
+    ...
+
+
+def load(
+    fp: IO, *, preserve: bool = True, lazy: bool = False
+) -> Union[TOMLDocument, Dict[str, Any]]:
     """
     Load toml document from a file-like object.
     """
-    return parse(fp.read())
+    return parse(fp.read(), preserve=preserve, lazy=lazy)
 
 
 def dump(data: Mapping, fp: IO[str], *, sort_keys: bool = False) -> None:
     """
     Dump a TOMLDocument into a writable file stream.
+
+    The document is written in chunks as it is rendered.
     """
-    fp.write(dumps(data, sort_keys=sort_keys))
+    if not isinstance(data, Container) and isinstance(data, Mapping):
+        data = item(dict(data), _sort_keys=sort_keys).value
+
+    if not isinstance(data, Container):
+        raise TypeError(f"Expecting Mapping or TOML Container, {type(data)} given")
+
+    data.write_to(fp)
 
 
-def parse(string: str) -> TOMLDocument:
+@overload
+def parse(
+    string: str, *, preserve: Literal[True] = ..., lazy: bool = ...
+) -> TOMLDocument:
+    ...
+
+
+@overload
+def parse(string: str, *, preserve: Literal[False], lazy: bool = ...) -> Dict[str, Any]:
+    ...
+
+
+@overload
+def parse(
+    string: str, *, preserve: bool = ..., lazy: bool = ...
+) -> Union[TOMLDocument, Dict[str, Any]]:
+    ...
+
+
+def parse(
+    string: str, *, preserve: bool = True, lazy: bool = False
+) -> Union[TOMLDocument, Dict[str, Any]]:
     """
     Parses a string into a TOMLDocument.
+
+    If preserve is False, the style of the document is not kept and
+    plain dicts, lists and scalars are returned instead, which is faster.
+
+    If lazy is True, the strings, numbers and dates assigned to keys are
+    only parsed when they are read, so that reading a few values of a large
+    document is faster. Errors in those values are raised when they are read.
     """
-    return Parser(string).parse()
+    try:
+        if not preserve:
+            return Parser(string).parse_values()
+
+        return Parser(string, lazy=lazy).parse()
+    except ParseError as e:
+        # The position is computed now so that the error
+        # does not keep the parsed string alive
+        e._resolve()
+
+        raise
 
 
 def document() -> TOMLDocument:
@@ -140,11 +228,21 @@ def key(k: str) -> Key:
 
 
 def value(raw: str) -> _Item:
-    return Parser(raw)._parse_value()
+    try:
+        return Parser(raw)._parse_value()
+    except ParseError as e:
+        e._resolve()
+
+        raise
 
 
 def key_value(src: str) -> Tuple[Key, _Item]:
-    return Parser(src)._parse_key_value()
+    try:
+        return Parser(src)._parse_key_value()
+    except ParseError as e:
+        e._resolve()
+
+        raise
 
 
 def ws(src: str) -> Whitespace:
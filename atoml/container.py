@@ -1,15 +1,35 @@
 import copy
+import weakref
 
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from ._compat import decode
-from ._utils import merge_dicts
+from ._utils import copied_dicts, merged_dicts
 from .exceptions import ATOMLError, KeyAlreadyPresent, NonExistentKey
-from .items import AoT, Comment, Item, Key, Null, Table, Whitespace, _CustomDict
+from .items import (
+    _APPENDED,
+    AbstractTable,
+    AoT,
+    Comment,
+    Item,
+    Key,
+    LazyScalar,
+    Null,
+    Table,
+    Whitespace,
+    _CustomDict,
+    _RenderCache,
+)
 from .items import item as _item
 
 
 _NOT_SET = object()
+# Removed items are compacted away once there are at least this many of them
+# and they make up half of the body, so that the cost is amortized over the
+# removals that created them.
+_COMPACT_MIN_TOMBSTONES = 16
+# Number of characters gathered before each write of write_to()
+_WRITE_CHUNK_SIZE = 64 * 1024
 
 
 class Container(_CustomDict):
@@ -17,18 +37,99 @@ class Container(_CustomDict):
     A container for items within a TOMLDocument.
     """
 
+    # True for the containers merging the tables of an OutOfOrderTableProxy,
+    # which are only views of the tables
+    _is_view = False
+
     def __init__(self, parsed: bool = False) -> None:
         self._map: Dict[Key, int] = {}
         self._body: List[Tuple[Optional[Key], Item]] = []
         self._parsed = parsed
         self._table_keys = []
+        # Index of the first table or AoT in the body, None if there is none
+        # and _NOT_SET when it has to be looked up again
+        self._first_table: Any = None
+        # Number of (None, Null()) entries left behind by removed items
+        self._tombstones = 0
+        # Unwrapped value, computed on first access and reset on mutation
+        self._value_cache: Optional[Dict[Any, Any]] = None
+        # Containers whose value embeds this one, keyed by their id
+        self._parents: "weakref.WeakValueDictionary[int, Container]" = (
+            weakref.WeakValueDictionary()
+        )
+        # Incremented on every change made to this container or below it
+        self._version = 0
+        # Proxies of the out-of-order tables already looked up, by key
+        self._proxies: Dict[Key, OutOfOrderTableProxy] = {}
+        # Text of the entries of the body, filled by _render()
+        self._render_cache: Optional[_RenderCache] = None
+        # Number of values of the body left unparsed by a lazy parser,
+        # and the tables whose dict storage holds some of them
+        self._lazy_entries = 0
+        self._lazy_tables: Optional[List["weakref.ref[AbstractTable]"]] = None
 
     @property
     def body(self) -> List[Tuple[Optional[Key], Item]]:
+        if self._lazy_entries:
+            for idx, (_, item) in enumerate(self._body):
+                if isinstance(item, LazyScalar):
+                    self._parse_lazy(idx)
+
+            self._lazy_entries = 0
+            self._lazy_tables = None
+
         return self._body
 
+    def _parse_lazy(self, idx: int) -> Item:
+        """
+        Replaces the unparsed value at the given index of the body
+        by its item, which is returned.
+        """
+        key, lazy = self._body[idx]
+        it = lazy.item
+        self._body[idx] = (key, it)
+        self._lazy_entries -= 1
+        dict.__setitem__(self, key.key, it.value)
+        if self._render_cache is not None:
+            self._render_cache.replace(lazy, it)
+
+        for ref in self._lazy_tables or ():
+            table = ref()
+            if table is not None and dict.get(table, key.key) is lazy:
+                dict.__setitem__(table, key.key, it)
+
+        return it
+
+    def _watch(self, table: AbstractTable) -> None:
+        """
+        Records a table whose dict storage holds unparsed values of this
+        container, to store their items once they are parsed.
+        """
+        if self._lazy_tables is None:
+            self._lazy_tables = []
+        elif any(ref() is table for ref in self._lazy_tables):
+            return
+
+        self._lazy_tables.append(weakref.ref(table))
+
     @property
     def value(self) -> Dict[Any, Any]:
+        """
+        The content of the container as plain Python values.
+        """
+        return copied_dicts(self._cached_value())
+
+    def _cached_value(self) -> Dict[Any, Any]:
+        """
+        Returns the content of the container as plain Python values.
+
+        The result is cached until something in the container changes.
+        It is shared with the containers embedding this one,
+        so it must not be modified.
+        """
+        if self._value_cache is not None:
+            return self._value_cache
+
         d = {}
         for k, v in self._body:
             if k is None:
@@ -38,15 +139,42 @@ class Container(_CustomDict):
             v = v.value
 
             if isinstance(v, Container):
-                v = v.value
+                v = v._cached_value()
 
             if k in d:
-                merge_dicts(d[k], v)
+                d[k] = merged_dicts(d[k], v)
             else:
                 d[k] = v
 
+        self._value_cache = d
+
         return d
 
+    def _invalidate(self, child: Any = None) -> None:
+        """
+        Drops the cached value and text of this container and of the
+        containers that embed it, and marks their proxies as outdated.
+
+        child narrows down the text to drop to a single entry: it is either
+        the item of an entry replaced in place, or the container, array or
+        array of tables which changed below one of the items.
+        It is _APPENDED when an entry was added at the end of the body.
+        """
+        self._version += 1
+        self._value_cache = None
+        if self._render_cache is not None and not self._render_cache.invalidate(child):
+            self._render_cache = None
+
+        for parent in list(self._parents.values()):
+            parent._invalidate(self)
+
+    def _adopt(self, item: Item) -> None:
+        """
+        Records this container as a holder of the given item, so that changes
+        made through the item invalidate the cached value and text.
+        """
+        item._adopted_by(self)
+
     def parsing(self, parsing: bool) -> None:
         self._parsed = parsing
 
@@ -88,10 +216,10 @@ class Container(_CustomDict):
         if isinstance(item, Table):
             if item.name != key.key:
                 item.invalidate_display_name()
-            if self._body and not (self._parsed or item.trivia.indent or prev_ws):
+            if prev is not None and not (self._parsed or item.trivia.indent or prev_ws):
                 item.trivia.indent = "\n"
 
-        if isinstance(item, AoT) and self._body and not self._parsed:
+        if isinstance(item, AoT) and prev is not None and not self._parsed:
             item.invalidate_display_name()
             if item and not ("\n" in item[0].trivia.indent or prev_ws):
                 item[0].trivia.indent = "\n" + item[0].trivia.indent
@@ -142,21 +270,38 @@ class Container(_CustomDict):
                             self._map[key] = current_idx + (len(self._body),)
                             self._body.append((key, item))
                             self._table_keys.append(key)
+                            self._adopt(item)
+                            self._invalidate(_APPENDED)
 
                             # Building a temporary proxy to check for errors
                             OutOfOrderTableProxy(self, self._map[key])
 
                             return self
 
+                        if self._parsed and all(
+                            parent is self or parent._is_view
+                            for parent in current.value._parents.values()
+                        ):
+                            # No other container of the document being parsed
+                            # holds the table, so it is extended in place
+                            for k, v in item.value._body:
+                                current.append(k, v)
+
+                            self._invalidate(current)
+
+                            return self
+
                         # Create a new element to replace the old one
                         current = copy.deepcopy(current)
-                        for k, v in item.value.body:
+                        for k, v in item.value._body:
                             current.append(k, v)
                         self._body[
                             current_idx[-1]
                             if isinstance(current_idx, tuple)
                             else current_idx
                         ] = (current_body_element[0], current)
+                        self._adopt(current)
+                        self._invalidate(current_body_element[1])
 
                         return self
                     elif current_body_element[0].is_dotted():
@@ -176,24 +321,12 @@ class Container(_CustomDict):
                 raise KeyAlreadyPresent(key)
 
         is_table = isinstance(item, (Table, AoT))
-        if key is not None and self._body and not self._parsed:
+        if key is not None and prev is not None and not self._parsed:
             # If there is already at least one table in the current container
             # and the given item is not a table, we need to find the last
             # item that is not a table and insert after it
             # If no such item exists, insert at the top of the table
-            key_after = None
-            for i, (k, v) in enumerate(self._body):
-                if isinstance(v, Null):
-                    continue  # Null elements are inserted after deletion
-
-                if isinstance(v, Whitespace) and not v.is_fixed():
-                    continue
-
-                if not is_table and isinstance(v, (Table, AoT)):
-                    break
-
-                key_after = k or i  # last scalar, Array or InlineTable value
-
+            key_after = self._last_value_position(is_table)
             if key_after is not None:
                 if isinstance(key_after, int):
                     if key_after + 1 < len(self._body):
@@ -212,13 +345,13 @@ class Container(_CustomDict):
             else:
                 return self._insert_at(0, key, item)
 
-        if key in self._map:
+        if key is not None and key in self._map:
             current_idx = self._map[key]
             if isinstance(current_idx, tuple):
                 current_idx = current_idx[-1]
 
             current = self._body[current_idx][1]
-            if key is not None and not isinstance(current, Table):
+            if not isinstance(current, Table):
                 raise KeyAlreadyPresent(key)
 
             # Adding sub tables to a currently existing table
@@ -226,19 +359,35 @@ class Container(_CustomDict):
                 current_idx = (current_idx,)
 
             self._map[key] = current_idx + (len(self._body),)
-        else:
+        elif key is not None:
             self._map[key] = len(self._body)
 
+        if self._first_table is None and isinstance(item, (Table, AoT)):
+            self._first_table = len(self._body)
+
         self._body.append((key, item))
         if item.is_table():
             self._table_keys.append(key)
 
-        if key is not None:
+        self._adopt(item)
+        self._invalidate(_APPENDED)
+
+        if isinstance(item, LazyScalar):
+            # Unparsed values are only built when they are read
+            self._lazy_entries += 1
+            dict.__setitem__(self, key.key, item)
+        elif key is not None:
             dict.__setitem__(self, key.key, item.value)
 
         return self
 
     def remove(self, key: Union[Key, str]) -> "Container":
+        self._remove(key)
+        self._maybe_compact()
+
+        return self
+
+    def _remove(self, key: Union[Key, str]) -> None:
         if not isinstance(key, Key):
             key = Key(key)
 
@@ -246,16 +395,62 @@ class Container(_CustomDict):
         if idx is None:
             raise NonExistentKey(key)
 
-        if isinstance(idx, tuple):
-            for i in idx:
-                self._body[i] = (None, Null())
-        else:
-            self._body[idx] = (None, Null())
+        if not isinstance(idx, tuple):
+            idx = (idx,)
+
+        for i in idx:
+            self._body[i] = (None, Null())
+
+        self._tombstones += len(idx)
+        if self._first_table in idx:
+            self._first_table = _NOT_SET
+
+        # The proxy would keep the removed tables alive
+        self._proxies.pop(key, None)
+        self._invalidate()
 
         dict.__delitem__(self, key.key)
 
+    def compact(self) -> "Container":
+        """
+        Drops the entries left behind by removed items and rebuilds
+        the index of the remaining ones.
+
+        This happens automatically once removed items make up half of
+        the container, but long-lived documents can call it explicitly.
+        """
+        if not self._tombstones:
+            return self
+
+        self._body[:] = [
+            (k, v) for k, v in self._body if k is not None or not isinstance(v, Null)
+        ]
+        self._map = {}
+        for i, (k, _) in enumerate(self._body):
+            if k is None:
+                continue
+
+            if k in self._map:
+                current_idx = self._map[k]
+                if not isinstance(current_idx, tuple):
+                    current_idx = (current_idx,)
+
+                self._map[k] = current_idx + (i,)
+            else:
+                self._map[k] = i
+
+        self._tombstones = 0
+        self._first_table = _NOT_SET
+        # The cached text is laid out like the body
+        self._render_cache = None
+
         return self
 
+    def _maybe_compact(self) -> None:
+        tombstones = self._tombstones
+        if tombstones >= _COMPACT_MIN_TOMBSTONES and tombstones * 2 >= len(self._body):
+            self.compact()
+
     def _insert_after(
         self, key: Union[Key, str], other_key: Union[Key, str], item: Any
     ) -> "Container":
@@ -281,22 +476,11 @@ class Container(_CustomDict):
         if "\n" not in current_item.trivia.trail:
             current_item.trivia.trail += "\n"
 
-        # Increment indices after the current index
-        for k, v in self._map.items():
-            if isinstance(v, tuple):
-                new_indices = []
-                for v_ in v:
-                    if v_ > idx:
-                        v_ = v_ + 1
-
-                    new_indices.append(v_)
-
-                self._map[k] = tuple(new_indices)
-            elif v > idx:
-                self._map[k] = v + 1
-
-        self._map[other_key] = idx + 1
         self._body.insert(idx + 1, (other_key, item))
+        self._shift_indices(idx + 1)
+        self._map[other_key] = idx + 1
+        self._adopt(item)
+        self._invalidate()
 
         if key is not None:
             dict.__setitem__(self, other_key.key, item.value)
@@ -322,28 +506,81 @@ class Container(_CustomDict):
             ):
                 previous_item.trivia.trail += "\n"
 
-        # Increment indices after the current index
-        for k, v in self._map.items():
-            if isinstance(v, tuple):
-                new_indices = []
-                for v_ in v:
-                    if v_ >= idx:
-                        v_ = v_ + 1
-
-                    new_indices.append(v_)
-
-                self._map[k] = tuple(new_indices)
-            elif v >= idx:
-                self._map[k] = v + 1
-
-        self._map[key] = idx
         self._body.insert(idx, (key, item))
+        self._shift_indices(idx)
+        self._map[key] = idx
+        self._adopt(item)
+        self._invalidate()
 
         if key is not None:
             dict.__setitem__(self, key.key, item.value)
 
         return self
 
+    def _shift_indices(self, idx: int) -> None:
+        """
+        Moves the indices of the items following a new entry at ``idx``
+        one position further.
+        Only the tail of the body is visited, so inserting in front of
+        a few trailing tables does not depend on the size of the table.
+        """
+        if self._first_table is not _NOT_SET:
+            if self._first_table is not None and self._first_table >= idx:
+                self._first_table += 1
+
+            if isinstance(self._body[idx][1], (Table, AoT)) and (
+                self._first_table is None or idx < self._first_table
+            ):
+                self._first_table = idx
+
+        shifted = set()
+        for i in range(idx + 1, len(self._body)):
+            k = self._body[i][0]
+            if k is None or k in shifted:
+                continue
+
+            v = self._map.get(k)
+            if isinstance(v, tuple):
+                self._map[k] = tuple(v_ + 1 if v_ >= idx else v_ for v_ in v)
+                shifted.add(k)
+            elif v is not None:
+                self._map[k] = v + 1
+
+    def _last_value_position(self, is_table: bool) -> Union[Key, int, None]:
+        """
+        Returns the key, or the index if it has none, of the last item
+        a new item should be inserted after.
+        Plain values go after the last value preceding the first table,
+        tables go after the last item.
+        Whitespace that is not fixed and removed items are skipped.
+        """
+        if is_table:
+            end = len(self._body)
+        else:
+            if self._first_table is _NOT_SET:
+                self._first_table = next(
+                    (
+                        i
+                        for i, (_, v) in enumerate(self._body)
+                        if isinstance(v, (Table, AoT))
+                    ),
+                    None,
+                )
+
+            end = len(self._body) if self._first_table is None else self._first_table
+
+        for i in range(end - 1, -1, -1):
+            k, v = self._body[i]
+            if isinstance(v, Null):
+                continue  # Null elements are inserted after deletion
+
+            if isinstance(v, Whitespace) and not v.is_fixed():
+                continue
+
+            return k or i  # last scalar, Array or InlineTable value
+
+        return None
+
     def item(self, key: Union[Key, str]) -> Item:
         if not isinstance(key, Key):
             key = Key(key)
@@ -356,34 +593,149 @@ class Container(_CustomDict):
             # The item we are getting is an out of order table
             # so we need a proxy to retrieve the proper objects
             # from the parent container
-            return OutOfOrderTableProxy(self, idx)
+            return self._proxy(key, idx)
+
+        item = self._body[idx][1]
+        if isinstance(item, LazyScalar):
+            return self._parse_lazy(idx)
+
+        return item
+
+    def _proxy(self, key: Key, indices: Tuple[int]) -> "OutOfOrderTableProxy":
+        """
+        Returns the proxy of an out-of-order table, reusing the previous one
+        as long as the tables it is built from have not changed.
+        """
+        proxy = self._proxies.get(key)
+        if proxy is None or not proxy._is_current(indices):
+            proxy = self._proxies[key] = OutOfOrderTableProxy(self, indices)
 
-        return self._body[idx][1]
+        return proxy
 
     def last_item(self) -> Optional[Item]:
         if self._body:
             return self._body[-1][1]
 
     def as_string(self) -> str:
-        s = ""
-        for k, v in self._body:
-            if k is not None:
-                if isinstance(v, Table):
-                    s += self._render_table(k, v)
-                elif isinstance(v, AoT):
-                    s += self._render_aot(k, v)
+        return "".join(self._iter_fragments())
+
+    def write_to(self, fp: IO[str]) -> None:
+        """
+        Writes the string representation of the container to a text stream,
+        chunk by chunk instead of building the whole string first.
+
+        The text cached by as_string() is reused, but none is cached
+        so that memory stays flat.
+        """
+        chunk = []
+        size = 0
+        for fragment in self._render(None, fill=False):
+            chunk.append(fragment)
+            size += len(fragment)
+            if size >= _WRITE_CHUNK_SIZE:
+                fp.write("".join(chunk))
+                chunk = []
+                size = 0
+
+        if chunk:
+            fp.write("".join(chunk))
+
+    def _iter_fragments(self) -> Iterator[str]:
+        """
+        Yields the pieces of the string representation of the container,
+        which concatenate to as_string().
+        """
+        return self._render(None, fill=True)
+
+    def _render(self, context: Any, fill: bool) -> Iterator[str]:
+        """
+        Yields the string representation of the body in the given context
+        (see _render_entry()), reusing the text cached for the entries
+        which did not change since they were last rendered in that context.
+        The text of the other entries is cached only if fill is True.
+        """
+        cache = self._render_cache
+        if cache is None or cache.context != context:
+            if not fill:
+                for k, v in self._body:
+                    yield from self._render_entry(context, k, v, fill)
+
+                return
+
+            cache = self._render_cache = _RenderCache(context, len(self._body))
+
+        for i, (k, v) in enumerate(self._body):
+            text = cache.text(i)
+            if text is None:
+                if not fill:
+                    yield from self._render_entry(context, k, v, fill)
+
+                    continue
+
+                text = "".join(self._render_entry(context, k, v, fill))
+                cache.store(i, v, text)
+
+            yield text
+
+    def _render_entry(
+        self, context: Any, key: Optional[Key], item: Item, fill: bool
+    ) -> Iterator[str]:
+        """
+        Yields the string representation of an entry of the body.
+
+        The context is None for a body rendered on its own,
+        ("table", name, dotted) for the body of a table and
+        ("aot", name) for the body of an array of tables element.
+        """
+        if context is None:
+            if key is None:
+                yield from self._render_simple_item(key, item)
+            elif isinstance(item, Table):
+                yield from self._render_table(key, item, fill=fill)
+            elif isinstance(item, AoT):
+                yield from self._render_aot(key, item, fill=fill)
+            else:
+                yield from self._render_simple_item(key, item)
+        elif context[0] == "table":
+            _, _key, dotted = context
+            if isinstance(item, Table):
+                if item.is_super_table():
+                    if key.is_dotted() and not dotted:
+                        # Dotted key inside table
+                        yield from self._render_table(key, item, fill=fill)
+                    else:
+                        yield from self._render_table(key, item, prefix=_key, fill=fill)
                 else:
-                    s += self._render_simple_item(k, v)
+                    yield from self._render_table(key, item, prefix=_key, fill=fill)
+            elif isinstance(item, AoT):
+                yield from self._render_aot(key, item, prefix=_key, fill=fill)
             else:
-                s += self._render_simple_item(k, v)
-
-        return s
+                yield from self._render_simple_item(
+                    key, item, prefix=_key if dotted else None
+                )
+        else:
+            _, _key = context
+            if isinstance(item, Table):
+                if item.is_super_table():
+                    if key.is_dotted():
+                        # Dotted key inside table
+                        yield from self._render_table(key, item, fill=fill)
+                    else:
+                        yield from self._render_table(key, item, prefix=_key, fill=fill)
+                else:
+                    yield from self._render_table(key, item, prefix=_key, fill=fill)
+            elif isinstance(item, AoT):
+                yield from self._render_aot(key, item, prefix=_key, fill=fill)
+            else:
+                yield from self._render_simple_item(key, item)
 
     def _render_table(
-        self, key: Key, table: Table, prefix: Optional[str] = None
-    ) -> str:
-        cur = ""
-
+        self,
+        key: Key,
+        table: Table,
+        prefix: Optional[str] = None,
+        fill: bool = True,
+    ) -> Iterator[str]:
         if table.display_name is not None:
             _key = table.display_name
         else:
@@ -394,7 +746,8 @@ class Container(_CustomDict):
 
         if not table.is_super_table() or (
             any(
-                not isinstance(v, (Table, AoT, Whitespace)) for _, v in table.value.body
+                not isinstance(v, (Table, AoT, Whitespace))
+                for _, v in table.value._body
             )
             and not key.is_dotted()
         ):
@@ -402,7 +755,7 @@ class Container(_CustomDict):
             if table.is_aot_element():
                 open_, close = "[[", "]]"
 
-            cur += "{}{}{}{}{}{}{}{}".format(
+            yield "{}{}{}{}{}{}{}{}".format(
                 table.trivia.indent,
                 open_,
                 decode(_key),
@@ -413,46 +766,25 @@ class Container(_CustomDict):
                 "\n" if "\n" not in table.trivia.trail and len(table.value) > 0 else "",
             )
 
-        for k, v in table.value.body:
-            if isinstance(v, Table):
-                if v.is_super_table():
-                    if k.is_dotted() and not key.is_dotted():
-                        # Dotted key inside table
-                        cur += self._render_table(k, v)
-                    else:
-                        cur += self._render_table(k, v, prefix=_key)
-                else:
-                    cur += self._render_table(k, v, prefix=_key)
-            elif isinstance(v, AoT):
-                cur += self._render_aot(k, v, prefix=_key)
-            else:
-                cur += self._render_simple_item(
-                    k, v, prefix=_key if key.is_dotted() else None
-                )
-
-        return cur
+        yield from table.value._render(("table", _key, key.is_dotted()), fill)
 
-    def _render_aot(self, key, aot, prefix=None):
+    def _render_aot(self, key, aot, prefix=None, fill=True):
         _key = key.as_string()
         if prefix is not None:
             _key = prefix + "." + _key
 
-        cur = ""
         _key = decode(_key)
-        for table in aot.body:
-            cur += self._render_aot_table(table, prefix=_key)
-
-        return cur
-
-    def _render_aot_table(self, table: Table, prefix: Optional[str] = None) -> str:
-        cur = ""
+        yield from aot._render(_key, fill, self._render_aot_table)
 
+    def _render_aot_table(
+        self, table: Table, prefix: Optional[str] = None, fill: bool = True
+    ) -> Iterator[str]:
         _key = prefix or ""
 
         if not table.is_super_table():
             open_, close = "[[", "]]"
 
-            cur += "{}{}{}{}{}{}{}".format(
+            yield "{}{}{}{}{}{}{}".format(
                 table.trivia.indent,
                 open_,
                 decode(_key),
@@ -462,39 +794,22 @@ class Container(_CustomDict):
                 table.trivia.trail,
             )
 
-        for k, v in table.value.body:
-            if isinstance(v, Table):
-                if v.is_super_table():
-                    if k.is_dotted():
-                        # Dotted key inside table
-                        cur += self._render_table(k, v)
-                    else:
-                        cur += self._render_table(k, v, prefix=_key)
-                else:
-                    cur += self._render_table(k, v, prefix=_key)
-            elif isinstance(v, AoT):
-                cur += self._render_aot(k, v, prefix=_key)
-            else:
-                cur += self._render_simple_item(k, v)
-
-        return cur
+        yield from table.value._render(("aot", _key), fill)
 
     def _render_simple_item(self, key, item, prefix=None):
         if key is None:
-            return item.as_string()
+            yield from item._iter_fragments()
+
+            return
 
         _key = key.as_string()
         if prefix is not None:
             _key = prefix + "." + _key
 
-        return "{}{}{}{}{}{}{}".format(
-            item.trivia.indent,
-            decode(_key),
-            key.sep,
-            decode(item.as_string()),
-            item.trivia.comment_ws,
-            decode(item.trivia.comment),
-            item.trivia.trail,
+        yield "{}{}{}".format(item.trivia.indent, decode(_key), key.sep)
+        yield from item._iter_fragments()
+        yield "{}{}{}".format(
+            item.trivia.comment_ws, decode(item.trivia.comment), item.trivia.trail
         )
 
     def __len__(self) -> int:
@@ -516,9 +831,11 @@ class Container(_CustomDict):
             # The item we are getting is an out of order table
             # so we need a proxy to retrieve the proper objects
             # from the parent container
-            return OutOfOrderTableProxy(self, idx)
+            return self._proxy(key, idx)
 
         item = self._body[idx][1]
+        if isinstance(item, LazyScalar):
+            item = self._parse_lazy(idx)
         if item.is_boolean():
             return item.value
 
@@ -551,6 +868,7 @@ class Container(_CustomDict):
             raise NonExistentKey(key)
 
         self._replace_at(idx, new_key, value)
+        self._maybe_compact()
 
     def _replace_at(
         self, idx: Union[int, Tuple[int]], new_key: Union[Key, str], value: Item
@@ -558,14 +876,21 @@ class Container(_CustomDict):
         if not isinstance(new_key, Key):
             new_key = Key(new_key)
 
+        # The other entries are left untouched, unless the item spans several
+        in_place = not isinstance(idx, tuple)
         if isinstance(idx, tuple):
             for i in idx[1:]:
                 self._body[i] = (None, Null())
 
+            self._tombstones += len(idx) - 1
+            if self._first_table in idx[1:]:
+                self._first_table = _NOT_SET
+
             idx = idx[0]
 
         k, v = self._body[idx]
 
+        self._proxies.pop(k, None)
         self._map[new_key] = self._map.pop(k)
         if new_key != k:
             dict.__delitem__(self, k)
@@ -577,7 +902,7 @@ class Container(_CustomDict):
 
         if isinstance(value, (AoT, Table)) and not isinstance(v, (AoT, Table)):
             # new tables should appear after all non-table values
-            self.remove(k)
+            self._remove(k)
             for i in range(idx, len(self._body)):
                 if isinstance(self._body[i][1], (AoT, Table)):
                     self._insert_at(i, new_key, value)
@@ -594,6 +919,11 @@ class Container(_CustomDict):
                 value.trivia.comment = value.trivia.comment or v.trivia.comment
                 value.trivia.trail = v.trivia.trail
             self._body[idx] = (new_key, value)
+            if isinstance(v, (AoT, Table)) or isinstance(value, (AoT, Table)):
+                self._first_table = _NOT_SET
+
+            self._adopt(value)
+            self._invalidate(v if in_place else None)
 
         if hasattr(value, "invalidate_display_name"):
             value.invalidate_display_name()  # type: ignore[attr-defined]
@@ -605,23 +935,32 @@ class Container(_CustomDict):
             last, _ = self._previous_item_with_index()
             idx = last if idx < 0 else idx
             has_ws = ends_with_withespace(value)
-            next_ws = idx < last and isinstance(self._body[idx + 1][1], Whitespace)
+            # Removed items are skipped, so that the layout does not depend
+            # on whether the container has been compacted
+            next_ws = idx < last and isinstance(
+                next(
+                    v
+                    for _, v in (self._body[i] for i in range(idx + 1, last + 1))
+                    if not isinstance(v, Null)
+                ),
+                Whitespace,
+            )
             if idx < last and not (next_ws or has_ws):
                 value.append(None, Whitespace("\n"))
 
             dict.__setitem__(self, new_key.key, value.value)
 
     def __str__(self) -> str:
-        return str(self.value)
+        return str(self._cached_value())
 
     def __repr__(self) -> str:
-        return repr(self.value)
+        return repr(self._cached_value())
 
     def __eq__(self, other: dict) -> bool:
         if not isinstance(other, dict):
             return NotImplemented
 
-        return self.value == other
+        return self._cached_value() == other
 
     def _getstate(self, protocol):
         return (self._parsed,)
@@ -641,9 +980,17 @@ class Container(_CustomDict):
         self._body = state[1]
         self._parsed = state[2]
         self._table_keys = state[3]
+        self._first_table = _NOT_SET
+        self._tombstones = sum(
+            1 for k, v in self._body if k is None and isinstance(v, Null)
+        )
 
         for key, item in self._body:
-            if key is not None:
+            self._adopt(item)
+            if isinstance(item, LazyScalar):
+                self._lazy_entries += 1
+                dict.__setitem__(self, key.key, item)
+            elif key is not None:
                 dict.__setitem__(self, key.key, item.value)
 
     def copy(self) -> "Container":
@@ -654,8 +1001,17 @@ class Container(_CustomDict):
         for k, v in dict.items(self):
             dict.__setitem__(c, k, v)
 
-        c._body += self.body
+        c._body += self._body
         c._map.update(self._map)
+        for _, item in c._body:
+            c._adopt(item)
+
+        c._first_table = _NOT_SET
+        c._tombstones = self._tombstones
+        c._lazy_entries = self._lazy_entries
+        # The copy holds the same items, so the text rendered from them holds
+        if self._render_cache is not None:
+            c._render_cache = self._render_cache.copy()
 
         return c
 
@@ -684,7 +1040,9 @@ class Container(_CustomDict):
 class OutOfOrderTableProxy(_CustomDict):
     def __init__(self, container: Container, indices: Tuple[int]) -> None:
         self._container = container
+        self._indices = indices
         self._internal_container = Container(True)
+        self._internal_container._is_view = True
         self._tables = []
         self._tables_map = {}
 
@@ -694,12 +1052,45 @@ class OutOfOrderTableProxy(_CustomDict):
             if isinstance(item, Table):
                 self._tables.append(item)
                 table_idx = len(self._tables) - 1
-                for k, v in item.value.body:
+                for k, v in item.value._body:
                     self._internal_container.append(k, v)
                     self._tables_map[k] = table_idx
                     if k is not None:
+                        if isinstance(v, LazyScalar):
+                            v = v.item
+
                         dict.__setitem__(self, k.key, v)
 
+        self._versions = self._table_versions()
+
+    def _table_versions(self) -> List[int]:
+        # Tables merged by the internal container are copies of the originals,
+        # so changes made through them are only visible in its own version
+        return [table.value._version for table in self._tables] + [
+            self._internal_container._version
+        ]
+
+    def _is_current(self, indices: Tuple[int]) -> bool:
+        """
+        Returns whether the proxy still reflects the tables at the given
+        indices of its container.
+        """
+        return (
+            indices == self._indices
+            and self._versions == self._table_versions()
+            and all(
+                table is item
+                for table, (_, item) in zip(
+                    self._tables,
+                    (
+                        self._container._body[i]
+                        for i in indices
+                        if isinstance(self._container._body[i][1], Table)
+                    ),
+                )
+            )
+        )
+
     @property
     def value(self):
         return self._internal_container.value
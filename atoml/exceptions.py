@@ -1,4 +1,8 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .source import Source
 
 
 class ATOMLError(Exception):
@@ -13,23 +17,72 @@ class ParseError(ValueError, ATOMLError):
     location within the line where the error was encountered.
     """
 
-    def __init__(self, line: int, col: int, message: Optional[str] = None) -> None:
+    def __init__(
+        self, line: Optional[int], col: Optional[int], message: Optional[str] = None
+    ) -> None:
         self._line = line
         self._col = col
+        self._source: Optional["Source"] = None
+        self._offset = 0
 
         if message is None:
             message = "TOML parse error"
 
-        super().__init__(f"{message} at line {self._line} col {self._col}")
+        self._message = message
+
+        super().__init__(f"{message} at line {line} col {col}")
+
+    def _locate(self, source: "Source", offset: int) -> "ParseError":
+        """
+        Attaches the error to an offset within the source. The line and column
+        are only computed when they are first read.
+        """
+        self._source = source
+        self._offset = offset
+        self._line = self._col = None
+        self.args = (self._message,)
+
+        return self
+
+    def _resolve(self) -> None:
+        """
+        Computes the line and column of an error attached to an offset
+        and releases the source.
+        """
+        if self._source is None:
+            return
+
+        line, col = self._source._to_linecol(self._offset)
+        self._source = None
+        self._set_position(line, col)
+
+    def _set_position(self, line: int, col: int) -> None:
+        self._line = line
+        self._col = col
+        self.args = (f"{self._message} at line {line} col {col}",)
 
     @property
     def line(self):
+        self._resolve()
+
         return self._line
 
     @property
     def col(self):
+        self._resolve()
+
         return self._col
 
+    def __str__(self) -> str:
+        self._resolve()
+
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._resolve()
+
+        return super().__repr__()
+
 
 class MixedArrayTypesError(ParseError):
     """
@@ -1,17 +1,21 @@
 import re
 import string
+import weakref
 
+from array import array
 from datetime import date, datetime, time, tzinfo
 from enum import Enum
 from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -20,6 +24,8 @@ from typing import (
 
 from ._compat import PY38, decode
 from ._utils import escape_quotes, escape_string
+from .exceptions import ParseError
+from .source import Source
 from .toml_char import TOMLChar
 
 
@@ -46,13 +52,29 @@ else:
     class _CustomList(MutableSequence, list):
         """Adds MutableSequence mixin while pretending to be a builtin list"""
 
+        __slots__ = ()
+
     class _CustomDict(MutableMapping, dict):
         """Adds MutableMapping mixin while pretending to be a builtin dict"""
 
+        __slots__ = ()
+
+
+# Type codes of the array.array holding integers or floats
+_NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+# array.array type code holding the NumPy numbers of each kind and size in bytes
+_NUMPY_TYPECODES = {
+    (kind, array(code).itemsize): code
+    for kind, codes in [("i", "bhilq"), ("u", "BHILQ"), ("f", "fd")]
+    for code in codes
+}
+
 
 def item(value, _parent=None, _sort_keys=False):
     from .container import Container
 
+    if isinstance(value, LazyScalar):
+        return value.item
     if isinstance(value, Item):
         return value
 
@@ -99,6 +121,23 @@ def item(value, _parent=None, _sort_keys=False):
             a.append(v)
 
         return a
+    elif isinstance(value, array) and value.typecode in _NUMERIC_TYPECODES:
+        return Array._from_numbers(array(value.typecode, value))
+    elif type(value).__module__ == "numpy":
+        # Arrays and scalars of NumPy, which is an optional dependency
+        kind = value.dtype.kind
+        if value.ndim == 1 and kind in "iuf":
+            typecode = _NUMPY_TYPECODES.get((kind, value.dtype.itemsize))
+            if typecode is None:
+                # Half and extended precision floats are held as doubles
+                typecode = _NUMPY_TYPECODES[(kind, 8)]
+
+            dtype = f"={kind}{array(typecode).itemsize}"
+            numbers = array(typecode, value.astype(dtype).tobytes())
+
+            return Array._from_numbers(numbers)
+
+        return item(value.tolist(), _parent=_parent, _sort_keys=_sort_keys)
     elif isinstance(value, str):
         escaped = escape_string(value)
 
@@ -193,6 +232,8 @@ class Trivia:
     Trivia information (aka metadata).
     """
 
+    __slots__ = ("indent", "comment_ws", "comment", "trail", "_owners")
+
     def __init__(
         self,
         indent: str = None,
@@ -200,17 +241,73 @@ class Trivia:
         comment: str = None,
         trail: str = None,
     ) -> None:
+        # The attributes are set without going through __setattr__ as there
+        # are no owners to invalidate yet, which keeps parsing fast
+        set_ = object.__setattr__
         # Whitespace before a value.
-        self.indent = indent or ""
+        set_(self, "indent", indent or "")
         # Whitespace after a value, but before a comment.
-        self.comment_ws = comment_ws or ""
+        set_(self, "comment_ws", comment_ws or "")
         # Comment, starting with # character, or empty string if no comment.
-        self.comment = comment or ""
+        set_(self, "comment", comment or "")
         # Trailing newline.
         if trail is None:
             trail = "\n"
 
-        self.trail = trail
+        set_(self, "trail", trail)
+        # Weak reference to the container, array or array of tables holding
+        # the item (or a tuple of them if there are several), which is
+        # invalidated whenever the trivia is changed
+        set_(self, "_owners", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+        if self._owners is not None:
+            self._changed()
+
+    def __getstate__(self) -> dict:
+        return {
+            "indent": self.indent,
+            "comment_ws": self.comment_ws,
+            "comment": self.comment,
+            "trail": self.trail,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def _changed(self, child: Any = None) -> None:
+        """
+        Invalidates the holders of the item.
+        child is the item itself if the change was made below it.
+        """
+        owners = self._owners
+        if owners is None:
+            return
+
+        if isinstance(owners, weakref.ref):
+            owners = (owners,)
+
+        for ref in owners:
+            owner = ref()
+            if owner is not None:
+                owner._invalidate(child)
+
+    def _add_owner(self, owner: Any) -> None:
+        owners = self._owners
+        if owners is None:
+            owners = ()
+        elif isinstance(owners, weakref.ref):
+            owners = (owners,)
+
+        # Weak references to the same object are not always the same object
+        if any(r() is owner for r in owners):
+            return
+
+        owners = tuple(r for r in owners if r() is not None)
+        ref = weakref.ref(owner)
+        object.__setattr__(self, "_owners", owners + (ref,) if owners else ref)
 
 
 class KeyType(Enum):
@@ -231,6 +328,8 @@ class Key:
     A key value.
     """
 
+    __slots__ = ("t", "sep", "key", "_original", "_dotted")
+
     def __init__(
         self,
         k: str,
@@ -288,12 +387,20 @@ class Key:
     def __repr__(self) -> str:
         return f"<Key {self.as_string()}>"
 
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.key, self.t, self.sep, self._dotted, self._original),
+        )
+
 
 class Item:
     """
     An item within a TOML document.
     """
 
+    __slots__ = ()
+
     def __init__(self, trivia: Trivia) -> None:
         self._trivia = trivia
 
@@ -308,6 +415,20 @@ class Item:
     def as_string(self) -> str:
         raise NotImplementedError()
 
+    def _iter_fragments(self) -> Iterator[str]:
+        """
+        Yields the pieces of the string representation of the item,
+        which concatenate to as_string().
+        """
+        yield self.as_string()
+
+    def _adopted_by(self, holder: Any) -> None:
+        """
+        Records that the item is held by a container, an array or an array
+        of tables, which is then invalidated whenever the item changes.
+        """
+        self._trivia._add_owner(holder)
+
     # Helpers
 
     def comment(self, comment: str) -> "Item":
@@ -354,6 +475,8 @@ class Whitespace(Item):
     A whitespace literal.
     """
 
+    __slots__ = ("_s", "_fixed")
+
     def __init__(self, s: str, fixed: bool = False) -> None:
         self._s = s
         self._fixed = fixed
@@ -380,6 +503,9 @@ class Whitespace(Item):
     def as_string(self) -> str:
         return self._s
 
+    def _adopted_by(self, holder: Any) -> None:
+        pass
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {repr(self._s)}>"
 
@@ -392,6 +518,8 @@ class Comment(Item):
     A comment literal.
     """
 
+    __slots__ = ("_trivia",)
+
     @property
     def discriminant(self) -> int:
         return 1
@@ -417,10 +545,7 @@ class Integer(int, Item):
         super().__init__(trivia)
 
         self._raw = raw
-        self._sign = False
-
-        if re.match(r"^[+\-]\d+$", raw):
-            self._sign = True
+        self._sign = len(raw) > 1 and raw[0] in "+-" and raw[1:].isdecimal()
 
     @property
     def discriminant(self) -> int:
@@ -477,6 +602,8 @@ class Float(float, Item):
     A float literal.
     """
 
+    __slots__ = ("_trivia", "_raw", "_sign")
+
     def __new__(cls, value: float, trivia: Trivia, raw: str) -> Integer:
         return super().__new__(cls, value)
 
@@ -484,10 +611,7 @@ class Float(float, Item):
         super().__init__(trivia)
 
         self._raw = raw
-        self._sign = False
-
-        if re.match(r"^[+\-].+$", raw):
-            self._sign = True
+        self._sign = len(raw) > 1 and raw[0] in "+-"
 
     @property
     def discriminant(self) -> int:
@@ -544,6 +668,8 @@ class Bool(Item):
     A boolean literal.
     """
 
+    __slots__ = ("_trivia", "_value")
+
     def __init__(self, t: int, trivia: Trivia) -> None:
         super().__init__(trivia)
 
@@ -586,6 +712,8 @@ class DateTime(Item, datetime):
     A datetime literal.
     """
 
+    __slots__ = ("_trivia", "_raw")
+
     def __new__(
         cls,
         year: int,
@@ -714,6 +842,8 @@ class Date(Item, date):
     A date literal.
     """
 
+    __slots__ = ("_trivia", "_raw")
+
     def __new__(cls, year: int, month: int, day: int, *_: Any) -> date:
         return date.__new__(cls, year, month, day)
 
@@ -768,6 +898,8 @@ class Time(Item, time):
     A time literal.
     """
 
+    __slots__ = ("_trivia", "_raw")
+
     def __new__(
         cls,
         hour: int,
@@ -821,16 +953,60 @@ class Array(Item, _CustomList):
     An array literal
     """
 
+    __slots__ = (
+        "_trivia",
+        "_value",
+        "_index_map",
+        "_multiline",
+        "_packed",
+        "__weakref__",
+    )
+
     def __init__(self, value: list, trivia: Trivia, multiline: bool = False) -> None:
         super().__init__(trivia)
-        self._index_map: Dict[int, int] = {}
+        # Positions in _value of the first elements of the list,
+        # extended on demand by _physical_index()
+        self._index_map: List[int] = []
+        # Numbers of an array built by _from_numbers(), until its items are needed
+        self._packed: Optional[array] = None
         list.__init__(
             self, [v.value for v in value if not isinstance(v, (Whitespace, Comment))]
         )
 
         self._value = value
         self._multiline = multiline
-        self._reindex()
+        for v in value:
+            v._adopted_by(self)
+
+    @classmethod
+    def _from_numbers(cls, numbers: array) -> "Array":
+        """
+        Creates an array of the given integers or floats, which are only
+        turned into items once the layout of the array is needed.
+        """
+        a = cls([], Trivia())
+        list.extend(a, numbers.tolist())
+        a._packed = numbers
+        # Left unset, _value is built by __getattr__()
+        del a._value
+
+        return a
+
+    def __getattr__(self, name: str) -> Any:
+        if name != "_value" or self._packed is None:
+            raise AttributeError(name)
+
+        numbers, self._packed = self._packed, None
+        value = []
+        for i, number in enumerate(numbers.tolist()):
+            it = item(number)
+            it._adopted_by(self)
+            if i:
+                value += [Whitespace(","), Whitespace(" ")]
+            value.append(it)
+        self._value = value
+
+        return value
 
     @property
     def discriminant(self) -> int:
@@ -840,32 +1016,112 @@ class Array(Item, _CustomList):
     def value(self) -> list:
         return self
 
+    def to_buffer(self) -> array:
+        """
+        Returns the numbers of the array in an ``array.array``,
+        which exposes them through the buffer protocol.
+        The array must hold only integers or only floats.
+        """
+        if self._packed is not None:
+            return array(self._packed.typecode, self._packed)
+
+        values = list.copy(self)
+        if all(isinstance(v, float) for v in values):
+            return array("d", values)
+
+        if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            try:
+                return array("q", values)
+            except OverflowError:
+                raise ValueError("Integers of the array do not fit in 64 bits")
+
+        raise ValueError("Array does not hold only integers or only floats")
+
+    def to_numpy(self) -> Any:
+        """
+        Returns the numbers of the array in a NumPy array, see to_buffer().
+        NumPy is an optional dependency.
+        """
+        import numpy
+
+        if self._packed is not None:
+            return numpy.array(self._packed)
+
+        return numpy.array(self.to_buffer())
+
     def multiline(self, multiline: bool) -> "Array":
         self._multiline = multiline
+        self._invalidate()
 
         return self
 
+    def _invalidate(self, child: Any = None) -> None:
+        # The holders of the array are the owners of its trivia
+        self._trivia._changed(self)
+
     def as_string(self) -> str:
+        return "".join(self._iter_fragments())
+
+    def _iter_fragments(self) -> Iterator[str]:
+        if self._packed is not None:
+            # Laid out as _value would be
+            numbers = map(str, self._packed.tolist())
+            if not self._multiline:
+                yield "[" + ", ".join(numbers) + "]"
+            else:
+                sep = ",\n" + self.trivia.indent + " " * 4
+                yield "[\n" + self.trivia.indent + " " * 4 + sep.join(numbers)
+                yield ",\n]"
+
+            return
+
         if not self._multiline:
-            return "[{}]".format("".join(v.as_string() for v in self._value))
+            yield "["
+            for v in self._value:
+                yield from v._iter_fragments()
 
-        s = "[\n" + self.trivia.indent + " " * 4
-        s += (",\n" + self.trivia.indent + " " * 4).join(
-            v.as_string() for v in self._value if not isinstance(v, Whitespace)
-        )
-        s += ",\n"
-        s += "]"
+            yield "]"
 
-        return s
+            return
 
-    def _reindex(self) -> None:
-        self._index_map.clear()
-        index = 0
-        for i, v in enumerate(self._value):
-            if isinstance(v, (Whitespace, Comment)):
+        sep = ",\n" + self.trivia.indent + " " * 4
+        yield "[\n" + self.trivia.indent + " " * 4
+        first = True
+        for v in self._value:
+            if isinstance(v, Whitespace):
                 continue
-            self._index_map[index] = i
-            index += 1
+
+            if not first:
+                yield sep
+
+            yield from v._iter_fragments()
+            first = False
+
+        yield ",\n]"
+
+    def _physical_index(self, index: int) -> int:
+        """
+        Returns the position in _value of the element at the given index,
+        which must not be negative.
+        """
+        index_map = self._index_map
+        if index >= len(index_map):
+            # Resume the scan where the map stops
+            start = index_map[-1] + 1 if index_map else 0
+            for i in range(start, len(self._value)):
+                if not isinstance(self._value[i], (Whitespace, Comment)):
+                    index_map.append(i)
+                    if len(index_map) > index:
+                        break
+
+        return index_map[index]
+
+    def _reindex(self, start: int = 0) -> None:
+        """
+        Forgets the positions of the elements from the given index,
+        as the elements before them have been added or removed.
+        """
+        del self._index_map[start:]
 
     def add_line(
         self,
@@ -904,6 +1160,7 @@ class Array(Item, _CustomList):
             el = item(el, _parent=self)
             if isinstance(el, Comment) or add_comma and isinstance(el, Whitespace):
                 raise ValueError(f"item type {type(el)} is not allowed")
+            el._adopted_by(self)
             if not isinstance(el, Whitespace):
                 new_values.append(el.value)
             append_item(el)
@@ -913,19 +1170,22 @@ class Array(Item, _CustomList):
                     append_item(Whitespace(" "))
         if comment:
             indent = " " if items else ""
-            append_item(
-                Comment(Trivia(indent=indent, comment=f"# {comment}", trail=""))
+            comment_item = Comment(
+                Trivia(indent=indent, comment=f"# {comment}", trail="")
             )
+            comment_item._adopted_by(self)
+            append_item(comment_item)
         # Atomic manipulation
         self._value[:] = values
         list.extend(self, new_values)
-        self._reindex()
+        self._invalidate()
 
     def clear(self) -> None:
         list.clear(self)
 
         self._value.clear()
         self._index_map.clear()
+        self._invalidate()
 
     def __len__(self) -> int:
         return list.__len__(self)
@@ -940,10 +1200,13 @@ class Array(Item, _CustomList):
             raise ValueError("slice assignment is not supported")
         if key < 0:
             key += len(self)
-        self._value[self._index_map[key]] = it
+        self._value[self._physical_index(key)] = it
+        it._adopted_by(self)
+        self._invalidate()
 
     def insert(self, pos: int, value: Any) -> None:
         it = item(value, _parent=self)
+        it._adopted_by(self)
         length = len(self)
         if not isinstance(it, (Comment, Whitespace)):
             list.insert(self, pos, it.value)
@@ -955,10 +1218,7 @@ class Array(Item, _CustomList):
         items = [it]
         idx = 0
         if pos < length:
-            try:
-                idx = self._index_map[pos]
-            except KeyError:
-                raise IndexError("list index out of range")
+            idx = self._physical_index(pos)
             if not isinstance(it, (Whitespace, Comment)):
                 items.append(Whitespace(","))
         else:
@@ -972,6 +1232,7 @@ class Array(Item, _CustomList):
                 if isinstance(it, Whitespace) and "," not in it.s:
                     # merge the whitespace
                     self._value[idx] = Whitespace(ws + it.s)
+                    self._invalidate()
                     return
             else:
                 ws = ""
@@ -991,17 +1252,44 @@ class Array(Item, _CustomList):
             else:
                 self._value.insert(i + 1, Whitespace(","))
 
-        self._reindex()
+        # The comma, if any, was added after the previous element
+        self._reindex(pos)
+        self._invalidate()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        items = [item(v, _parent=self) for v in values]
+        if any(isinstance(it, (Whitespace, Comment)) for it in items):
+            for it in items:
+                self.append(it)
+
+            return
+
+        if not items:
+            return
+
+        # The first value is laid out by insert(), the others are separated
+        # from the previous one the same way, before the trailing whitespace
+        first = items[0]
+        self.append(first)
+        pos = len(self._value) - 1
+        if self._value[pos] is not first:
+            pos -= 1
+        indent = self._value[pos - 1].s if pos < len(self._value) - 1 else " "
+
+        laid_out = []
+        for it in items[1:]:
+            it._adopted_by(self)
+            laid_out += [Whitespace(","), Whitespace(indent), it]
+        self._value[pos + 1 : pos + 1] = laid_out
+        list.extend(self, [it.value for it in items[1:]])
+        self._invalidate()
 
     def __delitem__(self, key: Union[int, slice]):
         length = len(self)
         list.__delitem__(self, key)
 
         def get_indice_to_remove(idx: int) -> Iterable[int]:
-            try:
-                real_idx = self._index_map[idx]
-            except KeyError:
-                raise IndexError("list index out of range")
+            real_idx = self._physical_index(idx)
             yield real_idx
             for i in range(real_idx + 1, len(self._value)):
                 if isinstance(self._value[i], Whitespace):
@@ -1011,17 +1299,24 @@ class Array(Item, _CustomList):
 
         indexes = set()
         if isinstance(key, slice):
-            for idx in range(key.start or 0, key.stop or length, key.step or 1):
+            removed = range(*key.indices(length))
+            for idx in removed:
                 indexes.update(get_indice_to_remove(idx))
+            self._reindex(min(removed, default=length))
         else:
-            indexes.update(get_indice_to_remove(length + key if key < 0 else key))
+            idx = length + key if key < 0 else key
+            indexes.update(get_indice_to_remove(idx))
+            self._reindex(idx)
         for i in sorted(indexes, reverse=True):
             del self._value[i]
         while self._value and isinstance(self._value[-1], Whitespace):
             self._value.pop()
-        self._reindex()
+        self._invalidate()
 
     def __str__(self):
+        if self._packed is not None:
+            return str(self._packed.tolist())
+
         return str(
             [v.value for v in self._value if not isinstance(v, (Whitespace, Comment))]
         )
@@ -1036,19 +1331,35 @@ AT = TypeVar("AT", bound="AbstractTable")
 class AbstractTable(Item, _CustomDict):
     """Common behaviour of both :class:`Table` and :class:`InlineTable`"""
 
+    __slots__ = ("_trivia", "_value", "__weakref__")
+
     def __init__(self, value: "container.Container", trivia: Trivia):
         Item.__init__(self, trivia)
 
         self._value = value
 
-        for k, v in self._value.body:
+        for k, v in self._value._body:
             if k is not None:
-                dict.__setitem__(self, k.key, v)
+                self._store(k.key, v)
 
     @property
     def value(self) -> "container.Container":
         return self._value
 
+    def _store(self, key: str, value: Item) -> None:
+        """
+        Stores the item of a key in the dict storage of the table.
+        Unparsed values are replaced by the container once they are parsed.
+        """
+        dict.__setitem__(self, key, value)
+        if isinstance(value, LazyScalar):
+            self._value._watch(self)
+
+    def _adopted_by(self, holder: Any) -> None:
+        super()._adopted_by(holder)
+
+        self._value._parents[id(holder)] = holder
+
     @overload
     def append(self: AT, key: None, value: Union[Comment, Whitespace]) -> AT:
         ...
@@ -1142,6 +1453,8 @@ class Table(AbstractTable):
     A table literal.
     """
 
+    __slots__ = ("name", "display_name", "_is_aot_element", "_is_super_table")
+
     def __init__(
         self,
         value: "container.Container",
@@ -1175,7 +1488,7 @@ class Table(AbstractTable):
             key = key.key
 
         if key is not None:
-            dict.__setitem__(self, key, _item)
+            self._store(key, _item)
 
         m = re.match("(?s)^[^ ]*([ ]+).*$", self._trivia.indent)
         if not m:
@@ -1202,7 +1515,7 @@ class Table(AbstractTable):
             key = key.key
 
         if key is not None:
-            dict.__setitem__(self, key, _item)
+            self._store(key, _item)
 
         return self
 
@@ -1215,6 +1528,9 @@ class Table(AbstractTable):
     def as_string(self) -> str:
         return self._value.as_string()
 
+    def _iter_fragments(self) -> Iterator[str]:
+        return self._value._iter_fragments()
+
     # Helpers
 
     def indent(self, indent: int) -> "Table":
@@ -1226,7 +1542,7 @@ class Table(AbstractTable):
         else:
             indent_str = m.group(1)
 
-        for _, item in self._value.body:
+        for _, item in self._value._body:
             if not isinstance(item, Whitespace):
                 item.trivia.indent = indent_str + item.trivia.indent
 
@@ -1234,6 +1550,7 @@ class Table(AbstractTable):
 
     def invalidate_display_name(self):
         self.display_name = None
+        self._value._invalidate()
 
         for child in self.values():
             if hasattr(child, "invalidate_display_name"):
@@ -1255,6 +1572,8 @@ class InlineTable(AbstractTable):
     An inline table literal.
     """
 
+    __slots__ = ("_new",)
+
     def __init__(
         self, value: "container.Container", trivia: Trivia, new: bool = False
     ) -> None:
@@ -1285,15 +1604,15 @@ class InlineTable(AbstractTable):
             key = key.key
 
         if key is not None:
-            dict.__setitem__(self, key, _item)
+            self._store(key, _item)
 
         return self
 
     def as_string(self) -> str:
         buf = "{"
-        for i, (k, v) in enumerate(self._value.body):
+        for i, (k, v) in enumerate(self._value._body):
             if k is None:
-                if i == len(self._value.body) - 1:
+                if i == len(self._value._body) - 1:
                     if self._new:
                         buf = buf.rstrip(", ")
                     else:
@@ -1312,7 +1631,7 @@ class InlineTable(AbstractTable):
                 v.trivia.trail.replace("\n", ""),
             )
 
-            if i != len(self._value.body) - 1:
+            if i != len(self._value._body) - 1:
                 buf += ","
                 if self._new:
                     buf += " "
@@ -1372,22 +1691,116 @@ class String(str, Item):
         return self._t, str(self), self._original, self._trivia
 
 
+# Passed to _invalidate() when an entry was added at the end of the body,
+# which leaves the text of the others unchanged
+_APPENDED = object()
+
+
+class _RenderCache:
+    """
+    Text rendered for each entry of a container or an array of tables
+    in a given context, so that only the entries which changed are
+    rendered again.
+
+    The text of an entry can also be stored as its span in a source text,
+    so that entries taken from a parsed document share the parsed string.
+    """
+
+    __slots__ = ("context", "entries", "source", "_positions")
+
+    def __init__(self, context: Any, size: int, source: str = "") -> None:
+        self.context = context
+        self.entries: List[Union[str, Tuple[int, int], None]] = [None] * size
+        self.source = source
+        # Position of the entry rendered from each item, and from the
+        # container of each table, by id; -1 if there are several
+        self._positions: Dict[int, int] = {}
+
+    def copy(self) -> "_RenderCache":
+        cache = _RenderCache(self.context, 0, self.source)
+        cache.entries = self.entries[:]
+        cache._positions = self._positions.copy()
+
+        return cache
+
+    def text(self, index: int) -> Optional[str]:
+        entry = self.entries[index]
+        if type(entry) is tuple:
+            start, end = entry
+
+            return self.source[start:end]
+
+        return entry
+
+    def store(self, index: int, item: Item, text: Union[str, Tuple[int, int]]) -> None:
+        """
+        Stores the text rendered from the item at the given index,
+        or its span in the source.
+        """
+        self.entries[index] = text
+        self._record(id(item), index)
+        if isinstance(item, AbstractTable):
+            self._record(id(item.value), index)
+
+    def _record(self, key: int, index: int) -> None:
+        if self._positions.setdefault(key, index) != index:
+            self._positions[key] = -1
+
+    def replace(self, old: Item, new: Item) -> None:
+        """
+        Records that the entry rendered from old is now held by new,
+        which renders the same text.
+        """
+        index = self._positions.pop(id(old), None)
+        if index is not None:
+            self._record(id(new), index)
+
+    def invalidate(self, child: Any) -> bool:
+        """
+        Drops the text of the entry rendered from child,
+        or makes room for the entry appended if child is _APPENDED.
+        Returns False if it is not known, in which case the whole cache
+        has to be dropped.
+        """
+        if child is _APPENDED:
+            self.entries.append(None)
+
+            return True
+
+        if child is None:
+            return False
+
+        index = self._positions.get(id(child))
+        if index is None:
+            # No text was cached for the entry it belongs to
+            return True
+        if index < 0:
+            return False
+
+        self.entries[index] = None
+
+        return True
+
+
 class AoT(Item, _CustomList):
     """
     An array of table literal
     """
 
+    __slots__ = ("_trivia", "name", "_body", "_parsed", "_render_cache", "__weakref__")
+
     def __init__(
         self, body: List[Table], name: Optional[str] = None, parsed: bool = False
     ) -> None:
         self.name = name
         self._body: List[Table] = []
         self._parsed = parsed
+        # Text of the tables, filled by _render()
+        self._render_cache: Optional[_RenderCache] = None
 
         super().__init__(Trivia(trail=""))
 
-        for table in body:
-            self.append(table)
+        self.extend(body)
 
     @property
     def body(self) -> List[Table]:
@@ -1421,6 +1834,7 @@ class AoT(Item, _CustomList):
     def __delitem__(self, key: Union[slice, int]) -> None:
         del self._body[key]
         list.__delitem__(self, key)
+        self._invalidate()
 
     def insert(self, index: int, value: Table) -> None:
         if not isinstance(value, Table):
@@ -1432,24 +1846,102 @@ class AoT(Item, _CustomList):
             index = 0
         elif index >= length:
             index = length
-        m = re.match("(?s)^[^ ]*([ ]+).*$", self._trivia.indent)
-        if m:
-            indent = m.group(1)
-
-            m = re.match("(?s)^([^ ]*)(.*)$", value.trivia.indent)
-            if not m:
-                value.trivia.indent = indent
-            else:
-                value.trivia.indent = m.group(1) + indent + m.group(2)
         prev_table = self._body[index - 1] if 0 < index and length else None
         next_table = self._body[index + 1] if index < length - 1 else None
+        self._lay_out(value, self._table_indent(), prev_table)
         if not self._parsed:
-            if prev_table and "\n" not in value.trivia.indent:
-                value.trivia.indent = "\n" + value.trivia.indent
             if next_table and "\n" not in next_table.trivia.indent:
                 next_table.trivia.indent = "\n" + next_table.trivia.indent
         self._body.insert(index, value)
         list.insert(self, index, value)
+        value._adopted_by(self)
+        self._invalidate(_APPENDED if index == length else None)
+
+    def extend(self, values: Iterable[Table]) -> None:
+        tables = list(values)
+        for table in tables:
+            if not isinstance(table, Table):
+                raise ValueError(f"Unsupported insert value type: {type(table)}")
+
+        if not tables:
+            return
+
+        indent = self._table_indent()
+        prev_table = self._body[-1] if self._body else None
+        for table in tables:
+            self._lay_out(table, indent, prev_table)
+            prev_table = table
+        self._body.extend(tables)
+        list.extend(self, tables)
+        for table in tables:
+            table._adopted_by(self)
+        if self._render_cache is not None:
+            # Makes room for the tables but the last, which _invalidate() does
+            self._render_cache.entries.extend([None] * (len(tables) - 1))
+        self._invalidate(_APPENDED)
+
+    def _table_indent(self) -> Optional[str]:
+        """
+        Returns the indent the tables get from the array, if any.
+        """
+        m = re.match("(?s)^[^ ]*([ ]+).*$", self._trivia.indent)
+
+        return m.group(1) if m else None
+
+    def _lay_out(
+        self, table: Table, indent: Optional[str], prev_table: Optional[Table]
+    ) -> None:
+        """
+        Indents a table added to the array, on a new line if it comes
+        after another table.
+        """
+        if indent is not None:
+            m = re.match("(?s)^([^ ]*)(.*)$", table.trivia.indent)
+            if not m:
+                table.trivia.indent = indent
+            else:
+                table.trivia.indent = m.group(1) + indent + m.group(2)
+        if not self._parsed and prev_table and "\n" not in table.trivia.indent:
+            table.trivia.indent = "\n" + table.trivia.indent
+
+    def _invalidate(self, child: Any = None) -> None:
+        if self._render_cache is not None and not self._render_cache.invalidate(child):
+            self._render_cache = None
+
+        # The holders of the array are the owners of its trivia
+        self._trivia._changed(self)
+
+    def _render(
+        self, context: str, fill: bool, render_table: Callable[..., Iterator[str]]
+    ) -> Iterator[str]:
+        """
+        Yields the string representation of the tables, rendered with
+        render_table(table, context, fill), reusing the text cached for
+        the tables which did not change since they were last rendered.
+        The text of the other tables is cached only if fill is True.
+        """
+        cache = self._render_cache
+        if cache is None or cache.context != context:
+            if not fill:
+                for table in self._body:
+                    yield from render_table(table, context, fill)
+
+                return
+
+            cache = self._render_cache = _RenderCache(context, len(self._body))
+
+        for i, table in enumerate(self._body):
+            text = cache.text(i)
+            if text is None:
+                if not fill:
+                    yield from render_table(table, context, fill)
+
+                    continue
+
+                text = "".join(render_table(table, context, fill))
+                cache.store(i, table, text)
+
+            yield text
 
     def invalidate_display_name(self):
         """Call ``invalidate_display_name`` on the contained tables"""
@@ -1458,11 +1950,11 @@ class AoT(Item, _CustomList):
                 child.invalidate_display_name()
 
     def as_string(self) -> str:
-        b = ""
-        for table in self._body:
-            b += table.as_string()
+        return "".join(self._iter_fragments())
 
-        return b
+    def _iter_fragments(self) -> Iterator[str]:
+        for table in self._body:
+            yield from table._iter_fragments()
 
     def __repr__(self) -> str:
         return f"<AoT {self.value}>"
@@ -1471,11 +1963,71 @@ class AoT(Item, _CustomList):
         return self._body, self.name, self._parsed
 
 
+class LazyScalar(Item):
+    """
+    A string, number or date left unparsed by a lazy parser,
+    built from its text when it is first read.
+    source is the parsed document and offset the position of the text in it,
+    from which the line and column of an error in the text are computed.
+
+    Containers replace it by its item when the value is read or when their
+    body is accessed. Until then, it is what the dict storage of containers
+    and tables holds, for code reading it with the methods of dict itself.
+    """
+
+    __slots__ = ("_trivia", "_raw", "_item", "_source", "_offset")
+
+    def __init__(self, raw: str, trivia: Trivia, source: str, offset: int) -> None:
+        super().__init__(trivia)
+
+        self._raw = raw
+        self._item: Optional[Item] = None
+        self._source = source
+        self._offset = offset
+
+    @property
+    def item(self) -> Item:
+        if self._item is None:
+            from .parser import Parser
+
+            try:
+                it = Parser(self._raw)._parse_value()
+            except ParseError as e:
+                # The text holds a single line, so the column of the error
+                # is its offset within the text
+                line, col = Source(self._source)._to_linecol(self._offset + e.col)
+                e._set_position(line, col)
+
+                raise
+
+            # The trivia still belongs to the containers holding the text
+            it._trivia = self._trivia
+            self._item = it
+
+        return self._item
+
+    @property
+    def discriminant(self) -> int:
+        return self.item.discriminant
+
+    @property
+    def value(self) -> Any:
+        return self.item.value
+
+    def as_string(self) -> str:
+        return self._raw
+
+    def _getstate(self, protocol=3):
+        return self._raw, self._trivia, self._source, self._offset
+
+
 class Null(Item):
     """
     A null item.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -1490,5 +2042,8 @@ class Null(Item):
     def as_string(self) -> str:
         return ""
 
+    def _adopted_by(self, holder: Any) -> None:
+        pass
+
     def _getstate(self, protocol=3):
         return tuple()
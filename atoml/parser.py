@@ -1,12 +1,14 @@
 import re
 import string
 
-from typing import Any, Iterator, List, Optional, Tuple, Type, Union
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple, Type, Union
 
 from ._compat import decode
 from ._utils import RFC_3339_LOOSE, _escaped, parse_rfc3339
 from .container import Container
 from .exceptions import (
+    ATOMLError,
     EmptyTableNameError,
     InternalParserError,
     InvalidCharInStringError,
@@ -16,6 +18,7 @@ from .exceptions import (
     InvalidNumberError,
     InvalidTimeError,
     InvalidUnicodeValueError,
+    KeyAlreadyPresent,
     ParseError,
     UnexpectedCharError,
     UnexpectedEofError,
@@ -34,6 +37,7 @@ from .items import (
     Item,
     Key,
     KeyType,
+    LazyScalar,
     Null,
     String,
     StringType,
@@ -41,17 +45,48 @@ from .items import (
     Time,
     Trivia,
     Whitespace,
+    _RenderCache,
 )
 from .source import Source
-from .toml_char import TOMLChar
+from .toml_char import BARE_CHARS, KV_CHARS, NL_CHARS, SPACES_CHARS, WS_CHARS
 from .toml_document import TOMLDocument
 
 
-CTRL_I = 0x09  # Tab
-CTRL_J = 0x0A  # Line feed
-CTRL_M = 0x0D  # Carriage return
-CTRL_CHAR_LIMIT = 0x1F
-CHR_DEL = 0x7F
+# Runs of characters that are skipped in a single step
+RE_SPACES = re.compile(r"[ \t]*")
+RE_WS = re.compile(r"[ \t\r\n]*")
+RE_INDENT = re.compile(r"[ \t\r]*")
+RE_BARE_KEY = re.compile(r"[A-Za-z0-9_\- \t]*")
+RE_COMMENT = re.compile(r"[^\x00-\x08\x0a-\x1f\x7f]*")
+RE_VALUE = re.compile(r"[^ \t\n\r#,\]}]*")
+RE_TIME = re.compile(r"[^\t\n\r#,\]}]*")
+
+# Arrays of decimal numbers without underscores, comments or nested values,
+# which are parsed in bulk, and the whitespace, commas and numbers inside them
+_RE_DECIMAL = r"[+-]?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?"
+RE_NUMBER_ARRAY = re.compile(
+    rf"\[[ \t\r\n]*{_RE_DECIMAL}(?:[ \t\r\n]*,[ \t\r\n]*{_RE_DECIMAL})*"
+    r"[ \t\r\n]*(?:,[ \t\r\n]*)?\]"
+)
+RE_NUMBER_ARRAY_TOKEN = re.compile(r"[ \t\r\n]+|,|[^ \t\r\n,]+")
+# A decimal number assigned as is, not followed by the rest of a date or time
+RE_DECIMAL_VALUE = re.compile(rf"{_RE_DECIMAL}(?![^ \t\n\r#,\]}}])")
+
+# Single-line strings left unparsed by a lazy parser
+RE_LAZY_STRING = {
+    '"': re.compile(
+        r'"[^"\\\x00-\x08\x0a-\x1f\x7f]*(?:\\.[^"\\\x00-\x08\x0a-\x1f\x7f]*)*"'
+    ),
+    "'": re.compile(r"'[^'\x00-\x08\x0a-\x1f\x7f]*'"),
+}
+
+# Characters that are copied verbatim into the value of each type of string
+RE_STRING_CHARS = {
+    StringType.SLB: re.compile(r'[^"\\\x00-\x08\x0a-\x1f\x7f]*'),
+    StringType.MLB: re.compile(r'[^"\\\x00-\x08\x0b\x0c\x0e-\x1f\x7f]*'),
+    StringType.SLL: re.compile(r"[^'\x00-\x08\x0a-\x1f\x7f]*"),
+    StringType.MLL: re.compile(r"[^'\x00-\x08\x0b\x0c\x0e-\x1f\x7f]*"),
+}
 
 
 class Parser:
@@ -59,9 +94,14 @@ class Parser:
     Parser for TOML documents.
     """
 
-    def __init__(self, string: str) -> None:
-        # Input to parse
-        self._src = Source(decode(string))
+    def __init__(self, string: str, lazy: bool = False) -> None:
+        string = decode(string)
+        # Input to parse, kept as is for the parsed document to output it
+        # while it is unchanged
+        self._string = string
+        self._src = Source(string)
+        # Whether strings, numbers and dates are only parsed when read
+        self._lazy = lazy
 
         self._aot_stack = []
 
@@ -107,6 +147,13 @@ class Parser:
         """
         return self._src.consume(chars=chars, min=min, max=max)
 
+    def skip(self, pattern: Pattern[str]) -> bool:
+        """
+        Moves past the run of characters matched by pattern.
+        Returns False if the end of the input has been reached.
+        """
+        return self._src.skip(pattern)
+
     def end(self) -> bool:
         """
         Returns True if the parser has reached the end of the input.
@@ -127,6 +174,9 @@ class Parser:
 
     def parse(self) -> TOMLDocument:
         body = TOMLDocument(True)
+        # Index of the last entry of the body, where its text starts and
+        # where the text of its tables starts if it is an AoT, see _seed_entry()
+        entry = None
 
         # Take all keyvals outside of tables/AoT's.
         while not self.end():
@@ -135,32 +185,121 @@ class Parser:
                 break
 
             # Otherwise, take and append one KV
+            start = self._idx
             item = self._parse_item()
             if not item:
                 break
 
             key, value = item
-            if key is not None and key.is_dotted():
-                # We actually have a table
-                self._handle_dotted_key(body, key, value)
-            elif not self._merge_ws(value, body):
-                body.append(key, value)
+            if not self._merge_ws(value, body):
+                self._seed_entry(body, entry, start)
+                entry = None
+                if key is not None and key.is_dotted():
+                    # We actually have a table
+                    self._handle_dotted_key(body, key, value)
+                else:
+                    entry = (len(body._body), start, None)
+                    body.append(key, value)
 
             self.mark()
 
         while not self.end():
-            key, value = self._parse_table()
+            start = self._src.marker
+            starts = [start]
+            key, value = self._parse_table(aot_starts=starts)
             if isinstance(value, Table) and value.is_aot_element():
                 # This is just the first table in an AoT. Parse the rest of the array
                 # along with it.
-                value = self._parse_aot(value, key.key)
+                value = self._parse_aot(value, key.key, starts)
 
+            self._seed_entry(body, entry, start)
+            entry = (len(body._body), start, starts)
             body.append(key, value)
+            if len(body._body) != entry[0] + 1:
+                # Merged into an existing entry
+                entry = None
 
+        self._seed_entry(body, entry, len(self._src))
         body.parsing(False)
+        body._source = (body._version, self._string)
 
         return body
 
+    def _seed_entry(
+        self,
+        body: TOMLDocument,
+        entry: Optional[Tuple[int, int, Optional[List[int]]]],
+        end: int,
+    ) -> None:
+        """
+        Caches the span of source text of the last entry parsed into the
+        document, which ends where the next one starts, as if it had been
+        rendered: it is output as is until it changes.
+
+        This is called before the next entry is added, so that the changes
+        that it makes to the previous ones drop their text as usual.
+        """
+        if entry is None:
+            return
+
+        index, start, starts = entry
+        key, item = body._body[index]
+        if isinstance(item, AoT):
+            # Its own text is joined from the text of its tables,
+            # which is rendered in the context of its name
+            if starts is None or len(starts) != len(item.body):
+                return
+
+            cache = item._render_cache = _RenderCache(
+                decode(key.as_string()), len(starts), self._string
+            )
+            for i, table in enumerate(item.body):
+                table_end = starts[i + 1] if i + 1 < len(starts) else end
+                cache.store(i, table, (starts[i], table_end))
+
+            return
+
+        cache = body._render_cache
+        if cache is None:
+            cache = body._render_cache = _RenderCache(
+                None, len(body._body), self._string
+            )
+
+        cache.store(index, item, (start, end))
+
+    def parse_values(self) -> Dict[str, Any]:
+        """
+        Parses the document into plain Python values.
+
+        The same grammar as parse() is accepted but no style information
+        is kept: tables are returned as dicts, arrays as lists and
+        scalars as their builtin types.
+        """
+        data = {}
+        namespaces = _Namespaces()
+        header = ()
+        while True:
+            self.skip(RE_INDENT)
+            if self.end():
+                break
+
+            c = self._current
+            if c == "\n":
+                self.inc()
+            elif c == "#":
+                self._parse_comment_trail()
+            elif c == "[":
+                header = self._parse_plain_table_header(data, namespaces)
+            else:
+                path = self._parse_key_path()
+                self._parse_key_value_sep()
+                value = self._parse_plain_value()
+                self._parse_comment_trail()
+
+                _insert_plain_value(data, namespaces, header, path, value)
+
+        return data
+
     def _merge_ws(self, item: Item, container: Container) -> bool:
         """
         Merges the given Item with the last one currently in the given Container if
@@ -176,8 +315,8 @@ class Parser:
             return False
 
         start = self._idx - (len(last.s) + len(item.s))
-        container.body[-1] = (
-            container.body[-1][0],
+        container._body[-1] = (
+            container._body[-1][0],
             Whitespace(self._src[start : self._idx]),
         )
 
@@ -203,8 +342,6 @@ class Parser:
         t = KeyType.Bare
         parts = 0
         for c in name:
-            c = TOMLChar(c)
-
             if c == ".":
                 if in_name:
                     current += c
@@ -227,20 +364,16 @@ class Parser:
                     else:
                         current += c
                 else:
-                    if (
-                        current.strip()
-                        and TOMLChar(current[-1]).is_spaces()
-                        and not parts
-                    ):
+                    if current.strip() and current[-1] in SPACES_CHARS and not parts:
                         raise self.parse_error()
 
                     in_name = True
                     t = KeyType.Literal if c == "'" else KeyType.Basic
                 original += c
-            elif in_name or c.is_bare_key_char():
+            elif in_name or c in BARE_CHARS:
                 current += c
                 original += c
-            elif c.is_spaces():
+            elif c in SPACES_CHARS:
                 # A space is only valid at this point
                 # if it's in between parts.
                 # We store it for now and will check
@@ -269,7 +402,7 @@ class Parser:
                     return None, Whitespace(self.extract())
                 elif c in " \t\r":
                     # Skip whitespace.
-                    if not self.inc():
+                    if not self.skip(RE_INDENT):
                         return None, Whitespace(self.extract())
                 elif c == "#":
                     # Found a comment, parse it
@@ -313,21 +446,17 @@ class Parser:
                 self.mark()
                 self.inc()  # Skip #
 
-                # The comment itself
-                while not self.end() and not self._current.is_nl():
+                # The comment itself, up to a new line or a control character
+                if self.skip(RE_COMMENT) and self._current not in NL_CHARS:
                     code = ord(self._current)
-                    if code == CHR_DEL or code <= CTRL_CHAR_LIMIT and code != CTRL_I:
-                        raise self.parse_error(InvalidControlChar, code, "comments")
-
-                    if not self.inc():
-                        break
+                    raise self.parse_error(InvalidControlChar, code, "comments")
 
                 comment = self.extract()
                 self.mark()
 
                 break
             elif c in " \t\r":
-                self.inc()
+                self.skip(RE_INDENT)
             else:
                 raise self.parse_error(UnexpectedCharError, c)
 
@@ -336,8 +465,7 @@ class Parser:
 
         trail = ""
         if parse_trail:
-            while self._current.is_spaces() and self.inc():
-                pass
+            self.skip(RE_SPACES)
 
             if self._current == "\r":
                 self.inc()
@@ -345,7 +473,7 @@ class Parser:
             if self._current == "\n":
                 self.inc()
 
-            if self._idx != self._marker or self._current.is_ws():
+            if self._idx != self._marker or self._current in WS_CHARS:
                 trail = self.extract()
 
         return comment_ws, comment, trail
@@ -354,33 +482,23 @@ class Parser:
         # Leading indent
         self.mark()
 
-        while self._current.is_spaces() and self.inc():
-            pass
+        self.skip(RE_SPACES)
 
         indent = self.extract()
 
         # Key
         key = self._parse_key()
-
-        self.mark()
-
-        found_equals = self._current == "="
-        while self._current.is_kv_sep() and self.inc():
-            if self._current == "=":
-                if found_equals:
-                    raise self.parse_error(UnexpectedCharError, "=")
-                else:
-                    found_equals = True
-        if not found_equals:
-            raise self.parse_error(UnexpectedCharError, self._current)
+        sep = self._parse_key_value_sep()
 
         if not key.sep:
-            key.sep = self.extract()
+            key.sep = sep
         else:
-            key.sep += self.extract()
+            key.sep += sep
 
         # Value
-        val = self._parse_value()
+        val = self._parse_lazy_value() if self._lazy else None
+        if val is None:
+            val = self._parse_value()
         # Comment
         if parse_comment:
             cws, comment, trail = self._parse_comment_trail()
@@ -397,6 +515,25 @@ class Parser:
 
         return key, val
 
+    def _parse_key_value_sep(self) -> str:
+        """
+        Parses the separator between a key and its value,
+        which must contain exactly one equals sign.
+        """
+        self.mark()
+
+        found_equals = self._current == "="
+        while self._current in KV_CHARS and self.inc():
+            if self._current == "=":
+                if found_equals:
+                    raise self.parse_error(UnexpectedCharError, "=")
+                else:
+                    found_equals = True
+        if not found_equals:
+            raise self.parse_error(UnexpectedCharError, self._current)
+
+        return self.extract()
+
     def _parse_key(self) -> Key:
         """
         Parses a Key at the current position;
@@ -448,10 +585,7 @@ class Parser:
         dotted = False
 
         self.mark()
-        while (
-            self._current.is_bare_key_char() or self._current.is_spaces()
-        ) and self.inc():
-            pass
+        self.skip(RE_BARE_KEY)
 
         original = self.extract()
         key = original.strip()
@@ -564,8 +698,7 @@ class Parser:
             "nan",
         }:
             # Number
-            while self._current not in " \t\n\r#,]}" and self.inc():
-                pass
+            self.skip(RE_VALUE)
 
             raw = self.extract()
 
@@ -576,8 +709,7 @@ class Parser:
             raise self.parse_error(InvalidNumberError)
         elif c in string.digits:
             # Integer, Float, Date, Time or DateTime
-            while self._current not in " \t\n\r#,]}" and self.inc():
-                pass
+            self.skip(RE_VALUE)
 
             raw = self.extract()
 
@@ -607,8 +739,7 @@ class Parser:
                         dt = parse_rfc3339(raw)
                         date = Date(dt.year, dt.month, dt.day, trivia, raw)
                         self.mark()
-                        while self._current not in "\t\n\r#,]}" and self.inc():
-                            pass
+                        self.skip(RE_TIME)
 
                         time_raw = self.extract()
                         if not time_raw.strip():
@@ -654,6 +785,39 @@ class Parser:
         else:
             raise self.parse_error(UnexpectedCharError, c)
 
+    def _parse_lazy_value(self) -> Optional[Item]:
+        """
+        Moves past the single-line string, number or date at the current
+        position and returns it unparsed. Returns None for the other values,
+        which are parsed as usual.
+        """
+        c = self._current
+        if c in RE_LAZY_STRING:
+            if self._src.startswith(c * 3, self._idx):
+                return None
+
+            m = RE_LAZY_STRING[c].match(self._src, self._idx)
+            if m is None:
+                return None
+        elif (
+            c in "+-"
+            or c in string.digits
+            or self._src.startswith(("inf", "nan"), self._idx)
+        ):
+            m = RE_VALUE.match(self._src, self._idx)
+            date = RFC_3339_LOOSE.match(m.group())
+            if date and date.group(1) and not date.group(5):
+                # A date may be followed by a time after a space
+                return None
+        else:
+            return None
+
+        # Errors found once the value is read are located from this offset
+        offset = self._idx
+        self.inc_n(m.end() - offset)
+
+        return LazyScalar(m.group(), Trivia(), self._string, offset)
+
     def _parse_true(self):
         return self._parse_bool(BoolType.TRUE)
 
@@ -672,6 +836,10 @@ class Parser:
             return Bool(style, Trivia())
 
     def _parse_array(self) -> Array:
+        tokens = self._parse_number_array()
+        if tokens is not None:
+            return _number_array(tokens)
+
         # Consume opening bracket, EOF here is an issue (middle of array)
         self.inc(exception=UnexpectedEofError)
 
@@ -680,9 +848,9 @@ class Parser:
         while True:
             # consume whitespace
             mark = self._idx
-            self.consume(TOMLChar.SPACES + TOMLChar.NL)
+            self.skip(RE_WS)
             indent = self._src[mark : self._idx]
-            newline = set(TOMLChar.NL) & set(indent)
+            newline = NL_CHARS.intersection(indent)
             if newline:
                 elems.append(Whitespace(indent))
                 continue
@@ -699,13 +867,10 @@ class Parser:
                 continue
 
             # consume value
-            if not prev_value:
-                try:
-                    elems.append(self._parse_value())
-                    prev_value = True
-                    continue
-                except UnexpectedCharError:
-                    pass
+            if not prev_value and self._current not in ",]":
+                elems.append(self._parse_value())
+                prev_value = True
+                continue
 
             # consume comma
             if prev_value and self._current == ",":
@@ -729,6 +894,20 @@ class Parser:
         else:
             return res
 
+    def _parse_number_array(self) -> Optional[List[str]]:
+        """
+        Moves past the array at the current position if it only holds
+        decimal numbers and returns the whitespace runs, commas and numbers
+        found between its brackets. Returns None otherwise, without moving.
+        """
+        m = RE_NUMBER_ARRAY.match(self._src, self._idx)
+        if m is None:
+            return None
+
+        self.inc_n(m.end() - self._idx)
+
+        return RE_NUMBER_ARRAY_TOKEN.findall(self._src, m.start() + 1, m.end() - 1)
+
     def _parse_inline_table(self) -> InlineTable:
         # consume opening bracket, EOF here is an issue (middle of array)
         self.inc(exception=UnexpectedEofError)
@@ -738,7 +917,7 @@ class Parser:
         while True:
             # consume leading whitespace
             mark = self._idx
-            self.consume(TOMLChar.SPACES)
+            self.skip(RE_SPACES)
             raw = self._src[mark : self._idx]
             if raw:
                 elems.add(Whitespace(raw))
@@ -772,7 +951,7 @@ class Parser:
 
             # consume trailing whitespace
             mark = self._idx
-            self.consume(TOMLChar.SPACES)
+            self.skip(RE_SPACES)
             raw = self._src[mark : self._idx]
             if raw:
                 elems.add(Whitespace(raw))
@@ -840,7 +1019,7 @@ class Parser:
             return self._parse_string(StringType.SLB)
 
     def _parse_escaped_char(self, multiline):
-        if multiline and self._current.is_ws():
+        if multiline and self._current in WS_CHARS:
             # When the last non-whitespace character on a line is
             # a \, it will be trimmed along with all whitespace
             # (including newlines) up to the next non-whitespace
@@ -848,17 +1027,14 @@ class Parser:
             # """\
             #     hello \
             #     world"""
-            tmp = ""
-            while self._current.is_ws():
-                tmp += self._current
-                # consume the whitespace, EOF here is an issue
-                # (middle of string)
-                self.inc(exception=UnexpectedEofError)
-                continue
+            mark = self._idx
+            # consume the whitespace, EOF here is an issue (middle of string)
+            if not self.skip(RE_WS):
+                raise self.parse_error(UnexpectedEofError)
 
             # the escape followed by whitespace must have a newline
             # before any other chars
-            if "\n" not in tmp:
+            if "\n" not in self._src[mark : self._idx]:
                 raise self.parse_error(InvalidCharInStringError, self._current)
 
             return ""
@@ -885,6 +1061,15 @@ class Parser:
         raise self.parse_error(InvalidCharInStringError, self._current)
 
     def _parse_string(self, delim: StringType) -> String:
+        delim, value, original = self._scan_string(delim)
+
+        return String(delim, value, original, Trivia())
+
+    def _scan_string(self, delim: StringType) -> Tuple[StringType, str, str]:
+        """
+        Moves past the string at the current position and returns
+        its actual type, its value and its original text.
+        """
         # only keep parsing for string if the current character matches the delim
         if self._current != delim.unit:
             raise self.parse_error(
@@ -901,7 +1086,7 @@ class Parser:
             # that would simply imply an empty single line string
             if not self.inc() or self._current != delim.unit:
                 # Empty string
-                return String(delim, "", "", Trivia())
+                return delim, "", ""
 
             # consume the third delim, EOF here is an issue (middle of string)
             self.inc(exception=UnexpectedEofError)
@@ -916,30 +1101,21 @@ class Parser:
             # consume the newline, EOF here is an issue (middle of string)
             self.inc(exception=UnexpectedEofError)
 
-        escaped = False  # whether the previous key was ESCAPE
+        value = []
+        plain_chars = RE_STRING_CHARS[delim]
         while True:
-            code = ord(self._current)
-            if (
-                delim.is_singleline()
-                and not escaped
-                and (code == CHR_DEL or code <= CTRL_CHAR_LIMIT and code != CTRL_I)
-            ):
-                raise self.parse_error(InvalidControlChar, code, "strings")
-            elif (
-                delim.is_multiline()
-                and not escaped
-                and (
-                    code == CHR_DEL
-                    or code <= CTRL_CHAR_LIMIT
-                    and code not in [CTRL_I, CTRL_J, CTRL_M]
-                )
-            ):
-                raise self.parse_error(InvalidControlChar, code, "strings")
-            elif not escaped and self._current == delim.unit:
+            # copy the run of characters that need no processing in one slice
+            start = self._idx
+            if not self.skip(plain_chars):
+                # EOF here is an issue (middle of string)
+                raise self.parse_error(UnexpectedEofError)
+
+            value.append(self._src[start : self._idx])
+
+            if self._current == delim.unit:
                 # try to process current as a closing delim
                 original = self.extract()
 
-                close = ""
                 if delim.is_multiline():
                     # Consume the delimiters to see if we are at the end of the string
                     close = ""
@@ -950,52 +1126,47 @@ class Parser:
                     if len(close) < 3:
                         # Not a triple quote, leave in result as-is.
                         # Adding back the characters we already consumed
-                        value += close
+                        value.append(close)
                         continue
 
                     if len(close) == 3:
                         # We are at the end of the string
-                        return String(delim, value, original, Trivia())
+                        return delim, "".join(value), original
 
                     if len(close) >= 6:
                         raise self.parse_error(InvalidCharInStringError, self._current)
 
-                    value += close[:-3]
+                    value.append(close[:-3])
                     original += close[:-3]
-
-                    return String(delim, value, original, Trivia())
                 else:
                     # consume the closing delim, we do not care if EOF occurs as
                     # that would simply imply the end of self._src
                     self.inc()
 
-                return String(delim, value, original, Trivia())
-            elif delim.is_basic() and escaped:
-                # attempt to parse the current char as an escaped value, an exception
-                # is raised if this fails
-                value += self._parse_escaped_char(delim.is_multiline())
-
-                # no longer escaped
-                escaped = False
+                return delim, "".join(value), original
             elif delim.is_basic() and self._current == "\\":
                 # the next char is being escaped
-                escaped = True
-
                 # consume this char, EOF here is an issue (middle of string)
                 self.inc(exception=UnexpectedEofError)
-            else:
-                # this is either a literal string where we keep everything as is,
-                # or this is not a special escaped char in a basic string
-                value += self._current
 
-                # consume this char, EOF here is an issue (middle of string)
-                self.inc(exception=UnexpectedEofError)
+                # attempt to parse the current char as an escaped value, an exception
+                # is raised if this fails
+                value.append(self._parse_escaped_char(delim.is_multiline()))
+            else:
+                # only control characters are left at this point
+                code = ord(self._current)
+                raise self.parse_error(InvalidControlChar, code, "strings")
 
     def _parse_table(
-        self, parent_name: Optional[str] = None, parent: Optional[Table] = None
+        self,
+        parent_name: Optional[str] = None,
+        parent: Optional[Table] = None,
+        aot_starts: Optional[List[int]] = None,
     ) -> Tuple[Key, Union[Table, AoT]]:
         """
         Parses a table element.
+
+        If the table starts an AoT, aot_starts is passed on to _parse_aot().
         """
         if self._current != "[":
             raise self.parse_error(
@@ -1003,65 +1174,8 @@ class Parser:
             )
 
         indent = self.extract()
-        self.inc()  # Skip opening bracket
-
-        if self.end():
-            raise self.parse_error(UnexpectedEofError)
-
-        is_aot = False
-        if self._current == "[":
-            if not self.inc():
-                raise self.parse_error(UnexpectedEofError)
-
-            is_aot = True
-
-        # Consume any whitespace
-        self.mark()
-        while self._current.is_spaces() and self.inc():
-            pass
-
-        ws_prefix = self.extract()
-
-        # Key
-        if self._current in [StringType.SLL.value, StringType.SLB.value]:
-            delimiter = (
-                StringType.SLL
-                if self._current == StringType.SLL.value
-                else StringType.SLB
-            )
-            name = self._parse_string(delimiter)
-            name = "{delimiter}{name}{delimiter}".format(
-                delimiter=delimiter.value, name=name
-            )
-
-            self.mark()
-            while self._current != "]" and self.inc():
-                if self.end():
-                    raise self.parse_error(UnexpectedEofError)
-
-                pass
-
-            ws_suffix = self.extract()
-            name += ws_suffix
-        else:
-            self.mark()
-            while self._current != "]" and self.inc():
-                if self.end():
-                    raise self.parse_error(UnexpectedEofError)
-
-                pass
-
-            name = self.extract()
-
-        name = ws_prefix + name
-
-        if not name.strip():
-            raise self.parse_error(EmptyTableNameError)
-
+        is_aot, name, name_parts = self._parse_table_name()
         key = Key(name, sep="")
-        name_parts = tuple(self._split_table_name(name))
-        if any(" " in part.key.strip() and part.is_bare() for part in name_parts):
-            raise self.parse_error(ParseError, f'Invalid table name "{name}"')
 
         missing_table = False
         if parent_name:
@@ -1176,10 +1290,229 @@ class Parser:
             result = table
 
             if is_aot and (not self._aot_stack or name != self._aot_stack[-1]):
-                result = self._parse_aot(result, name)
+                result = self._parse_aot(result, name, aot_starts)
 
         return key, result
 
+    def _parse_plain_table_header(
+        self, data: Dict[str, Any], namespaces: "_Namespaces"
+    ) -> Tuple[str, ...]:
+        """
+        Parses a table header for parse_values() and creates the table.
+
+        Returns the path of the table.
+        """
+        is_aot, _, name_parts = self._parse_table_name()
+        path = tuple(part.key for part in name_parts)
+
+        self.inc()  # Skip closing bracket
+        if is_aot:
+            self.inc()
+
+        self._parse_comment_trail()
+
+        # Tables created by dotted keys in the previous section are now closed
+        namespaces.finalize_pending()
+        if is_aot:
+            if namespaces.is_frozen(path):
+                raise KeyAlreadyPresent(".".join(path))
+
+            # The new element starts with a clean slate
+            namespaces.reset(path)
+            namespaces.declare(path)
+            aot = _get_or_create_nest(data, path[:-1]).setdefault(path[-1], [])
+            if not isinstance(aot, list):
+                raise KeyAlreadyPresent(".".join(path))
+
+            aot.append({})
+        else:
+            if namespaces.is_dotted(path):
+                raise ATOMLError("Redefinition of an existing table")
+
+            if namespaces.is_declared(path) or namespaces.is_frozen(path):
+                raise KeyAlreadyPresent(".".join(path))
+
+            namespaces.declare(path)
+            _get_or_create_nest(data, path)
+
+        return path
+
+    def _parse_table_name(self) -> Tuple[bool, str, Tuple[Key, ...]]:
+        """
+        Parses the opening brackets and the name of a table header,
+        stopping on the closing bracket.
+
+        Returns whether the table is part of an AoT, its raw name
+        and the parts of the name.
+        """
+        self.inc()  # Skip opening bracket
+
+        if self.end():
+            raise self.parse_error(UnexpectedEofError)
+
+        is_aot = False
+        if self._current == "[":
+            if not self.inc():
+                raise self.parse_error(UnexpectedEofError)
+
+            is_aot = True
+
+        # Consume any whitespace
+        self.mark()
+        self.skip(RE_SPACES)
+
+        ws_prefix = self.extract()
+
+        # Key
+        if self._current in [StringType.SLL.value, StringType.SLB.value]:
+            delimiter = (
+                StringType.SLL
+                if self._current == StringType.SLL.value
+                else StringType.SLB
+            )
+            name = self._parse_string(delimiter)
+            name = "{delimiter}{name}{delimiter}".format(
+                delimiter=delimiter.value, name=name
+            )
+
+            self.mark()
+            while self._current != "]" and self.inc():
+                if self.end():
+                    raise self.parse_error(UnexpectedEofError)
+
+                pass
+
+            ws_suffix = self.extract()
+            name += ws_suffix
+        else:
+            self.mark()
+            while self._current != "]" and self.inc():
+                if self.end():
+                    raise self.parse_error(UnexpectedEofError)
+
+                pass
+
+            name = self.extract()
+
+        name = ws_prefix + name
+
+        if not name.strip():
+            raise self.parse_error(EmptyTableNameError)
+
+        name_parts = tuple(self._split_table_name(name))
+        if any(" " in part.key.strip() and part.is_bare() for part in name_parts):
+            raise self.parse_error(ParseError, f'Invalid table name "{name}"')
+
+        return is_aot, name, name_parts
+
+    def _parse_key_path(self) -> Tuple[str, ...]:
+        """
+        Parses a key, which may be dotted, into the names of its parts.
+        """
+        key = self._parse_key()
+        if key.is_dotted():
+            return tuple(k.key for k in self._split_table_name(key.as_string()))
+
+        return (key.key,)
+
+    def _parse_plain_value(self) -> Any:
+        """
+        Parses a value at the current position into a plain Python value.
+        """
+        c = self._current
+        if c == "[":
+            return self._parse_plain_array()
+        elif c == "{":
+            return self._parse_plain_inline_table()
+        elif c == '"':
+            return self._scan_string(StringType.SLB)[1]
+        elif c == "'":
+            return self._scan_string(StringType.SLL)[1]
+
+        m = RE_DECIMAL_VALUE.match(self._src, self._idx)
+        if m is not None:
+            self.inc_n(m.end() - self._idx)
+
+            return _parse_numbers([m.group()])[0]
+
+        return _plain_scalar(self._parse_value())
+
+    def _parse_plain_array(self) -> List[Any]:
+        tokens = self._parse_number_array()
+        if tokens is not None:
+            return _parse_numbers([t for t in tokens if t[0] not in " \t\r\n,"])
+
+        # Consume opening bracket, EOF here is an issue (middle of array)
+        self.inc(exception=UnexpectedEofError)
+
+        elems = []
+        prev_value = False
+        while True:
+            self.skip(RE_WS)
+
+            if self._current == "#":
+                self._parse_comment_trail(parse_trail=False)
+                continue
+
+            if not prev_value and self._current not in ",]":
+                elems.append(self._parse_plain_value())
+                prev_value = True
+                continue
+
+            if prev_value and self._current == ",":
+                self.inc(exception=UnexpectedEofError)
+                prev_value = False
+                continue
+
+            if self._current == "]":
+                # consume closing bracket, EOF here doesn't matter
+                self.inc()
+                break
+
+            raise self.parse_error(UnexpectedCharError, self._current)
+
+        return elems
+
+    def _parse_plain_inline_table(self) -> Dict[str, Any]:
+        # consume opening bracket, EOF here is an issue (middle of array)
+        self.inc(exception=UnexpectedEofError)
+
+        table = {}
+        namespaces = _Namespaces()
+        trailing_comma = None
+        while True:
+            self.skip(RE_SPACES)
+
+            if not trailing_comma:
+                if self._current == "}":
+                    # consume closing bracket, EOF here doesn't matter
+                    self.inc()
+                    break
+
+                if (
+                    trailing_comma is False
+                    or trailing_comma is None
+                    and self._current == ","
+                ):
+                    raise self.parse_error(UnexpectedCharError, self._current)
+            elif self._current == "}" or self._current == ",":
+                raise self.parse_error(UnexpectedCharError, self._current)
+
+            path = self._parse_key_path()
+            self._parse_key_value_sep()
+            value = self._parse_plain_value()
+
+            _insert_plain_value(table, namespaces, (), path, value)
+
+            self.skip(RE_SPACES)
+
+            trailing_comma = self._current == ","
+            if trailing_comma:
+                # consume closing bracket, EOF here is an issue (middle of inline table)
+                self.inc(exception=UnexpectedEofError)
+
+        return table
+
     def _peek_table(self) -> Tuple[bool, str]:
         """
         Peeks ahead non-intrusively by cloning then restoring the
@@ -1211,16 +1544,23 @@ class Parser:
 
             return is_aot, table_name
 
-    def _parse_aot(self, first: Table, name_first: str) -> AoT:
+    def _parse_aot(
+        self, first: Table, name_first: str, starts: Optional[List[int]] = None
+    ) -> AoT:
         """
         Parses all siblings of the provided table first and bundles them into
         an AoT.
+
+        Where the text of each sibling starts is appended to starts if given.
         """
         payload = [first]
         self._aot_stack.append(name_first)
         while not self.end():
             is_aot_next, name_next = self._peek_table()
             if is_aot_next and name_next == name_first:
+                if starts is not None:
+                    starts.append(self._src.marker)
+
                 _, table = self._parse_table(name_first)
                 payload.append(table)
             else:
@@ -1240,7 +1580,7 @@ class Parser:
         with self._state(restore=True):
             buf = ""
             for _ in range(n):
-                if self._current not in " \t\n\r#,]}":
+                if self._current not in " \t\n\r#,]}" and not self.end():
                     buf += self._current
                     self.inc()
                     continue
@@ -1284,3 +1624,200 @@ class Parser:
                     value = None
 
             return value, extracted
+
+
+class _Namespace:
+    __slots__ = ("declared", "dotted", "frozen", "children")
+
+    def __init__(self) -> None:
+        self.declared = False
+        self.dotted = False
+        self.frozen = False
+        self.children: Dict[str, "_Namespace"] = {}
+
+
+class _Namespaces:
+    """
+    Keeps track of how the tables of a document parsed by
+    Parser.parse_values() were defined, to reject redefinitions.
+
+    A declared table cannot be declared again and a frozen value,
+    i.e. an inline table or an array, cannot be extended at all.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Namespace()
+        self._pending: List[Tuple[str, ...]] = []
+
+    def _get(self, path: Tuple[str, ...], create: bool = False) -> Optional[_Namespace]:
+        node = self._root
+        for k in path:
+            if k not in node.children:
+                if not create:
+                    return None
+
+                node.children[k] = _Namespace()
+
+            node = node.children[k]
+
+        return node
+
+    def is_declared(self, path: Tuple[str, ...]) -> bool:
+        node = self._get(path)
+
+        return node is not None and node.declared
+
+    def is_dotted(self, path: Tuple[str, ...]) -> bool:
+        node = self._get(path)
+
+        return node is not None and node.dotted
+
+    def is_frozen(self, path: Tuple[str, ...]) -> bool:
+        node = self._root
+        for k in path:
+            node = node.children.get(k)
+            if node is None:
+                return False
+
+            if node.frozen:
+                return True
+
+        return False
+
+    def declare(self, path: Tuple[str, ...]) -> None:
+        self._get(path, create=True).declared = True
+
+    def declare_pending(self, path: Tuple[str, ...]) -> None:
+        """
+        Declares a table created by a dotted key once its section is closed.
+        """
+        self._pending.append(path)
+
+    def finalize_pending(self) -> None:
+        for path in self._pending:
+            node = self._get(path, create=True)
+            node.declared = node.dotted = True
+
+        self._pending.clear()
+
+    def freeze(self, path: Tuple[str, ...]) -> None:
+        self._get(path, create=True).frozen = True
+
+    def reset(self, path: Tuple[str, ...]) -> None:
+        parent = self._get(path[:-1])
+        if parent is not None:
+            parent.children.pop(path[-1], None)
+
+
+def _get_or_create_nest(data: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Returns the table at the given path, creating missing tables.
+    For an array of tables, its last element is used.
+    """
+    for k in path:
+        if k not in data:
+            data[k] = {}
+
+        data = data[k]
+        if isinstance(data, list):
+            data = data[-1]
+
+        if not isinstance(data, dict):
+            raise KeyAlreadyPresent(k)
+
+    return data
+
+
+def _insert_plain_value(
+    data: Dict[str, Any],
+    namespaces: _Namespaces,
+    header: Tuple[str, ...],
+    path: Tuple[str, ...],
+    value: Any,
+) -> None:
+    """
+    Inserts a key/value pair parsed within the table at ``header``.
+    """
+    for i in range(1, len(path)):
+        table = header + path[:i]
+        if namespaces.is_declared(table):
+            raise ATOMLError("Redefinition of an existing table")
+
+        namespaces.declare_pending(table)
+
+    parent = header + path[:-1]
+    if namespaces.is_frozen(parent):
+        raise KeyAlreadyPresent(".".join(path))
+
+    table = _get_or_create_nest(data, parent)
+    if path[-1] in table:
+        raise KeyAlreadyPresent(".".join(path))
+
+    if isinstance(value, (dict, list)):
+        namespaces.freeze(header + path)
+
+    table[path[-1]] = value
+
+
+def _parse_numbers(raws: List[str]) -> List[Union[int, float]]:
+    """
+    Converts decimal numbers matched by RE_NUMBER_ARRAY, all at once
+    if they are all integers.
+    """
+    try:
+        return list(map(int, raws))
+    except ValueError:
+        # Floats have a fraction or an exponent
+        return [float(r) if r.strip("+-0123456789") else int(r) for r in raws]
+
+
+def _number_array(tokens: List[str]) -> Array:
+    """
+    Builds the array of the tokens returned by Parser._parse_number_array(),
+    laid out as they are.
+    """
+    values = _parse_numbers([t for t in tokens if t[0] not in " \t\r\n,"])
+    elems: List[Item] = []
+    remaining = iter(values)
+    for token in tokens:
+        if token[0] not in " \t\r\n,":
+            value = next(remaining)
+            if isinstance(value, int):
+                elems.append(Integer(value, Trivia(), token))
+            else:
+                elems.append(Float(value, Trivia(), token))
+        else:
+            elems.append(Whitespace(token))
+
+    return Array(elems, Trivia())
+
+
+def _plain_scalar(item: Item) -> Any:
+    """
+    Converts a scalar item to the builtin type it wraps.
+    """
+    if isinstance(item, Bool):
+        return item.value
+    elif isinstance(item, String):
+        return str(item)
+    elif isinstance(item, Integer):
+        return int(item)
+    elif isinstance(item, Float):
+        return float(item)
+    elif isinstance(item, DateTime):
+        return datetime(
+            item.year,
+            item.month,
+            item.day,
+            item.hour,
+            item.minute,
+            item.second,
+            item.microsecond,
+            item.tzinfo,
+        )
+    elif isinstance(item, Date):
+        return date(item.year, item.month, item.day)
+    elif isinstance(item, Time):
+        return time(item.hour, item.minute, item.second, item.microsecond, item.tzinfo)
+
+    return item.value
@@ -1,11 +1,13 @@
-from copy import copy
-from typing import Any, Optional, Tuple, Type
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, List, Optional, Pattern, Tuple, Type
 
 from .exceptions import ParseError, UnexpectedCharError
-from .toml_char import TOMLChar
 
 
 class _State:
+    __slots__ = ("_source", "_save_marker", "restore", "_checkpoint")
+
     def __init__(
         self,
         source: "Source",
@@ -16,23 +18,16 @@ class _State:
         self._save_marker = save_marker
         self.restore = restore
 
-    def __enter__(self) -> None:
+    def __enter__(self) -> "_State":
         # Entering this context manager - save the state
-        self._chars = copy(self._source._chars)
-        self._idx = self._source._idx
-        self._current = self._source._current
-        self._marker = self._source._marker
+        self._checkpoint = self._source.checkpoint()
 
         return self
 
     def __exit__(self, exception_type, exception_val, trace):
         # Exiting this context manager - restore the prior state
         if self.restore or exception_type:
-            self._source._chars = self._chars
-            self._source._idx = self._idx
-            self._source._current = self._current
-            if self._save_marker:
-                self._source._marker = self._marker
+            self._source.rollback(self._checkpoint, restore_marker=self._save_marker)
 
 
 class _StateHandler:
@@ -47,8 +42,8 @@ class _StateHandler:
     def __call__(self, *args, **kwargs):
         return _State(self._source, *args, **kwargs)
 
-    def __enter__(self) -> None:
-        state = self()
+    def __enter__(self) -> "_State":
+        state = _State(self._source)
         self._states.append(state)
         return state.__enter__()
 
@@ -58,17 +53,17 @@ class _StateHandler:
 
 
 class Source(str):
-    EOF = TOMLChar("\0")
+    EOF = "\0"
 
     def __init__(self, _: str) -> None:
         super().__init__()
 
-        # Collection of TOMLChars
-        self._chars = iter([(i, TOMLChar(c)) for i, c in enumerate(self)])
-
-        self._idx = 0
+        # Position of the current character, -1 before the first ``inc()``
+        self._idx = -1
         self._marker = 0
-        self._current = TOMLChar("")
+        self._current = ""
+        # Offsets just past the end of each line, built on the first error
+        self._line_ends: Optional[List[int]] = None
 
         self._state = _StateHandler(self)
 
@@ -90,7 +85,7 @@ class Source(str):
         return self._idx
 
     @property
-    def current(self) -> TOMLChar:
+    def current(self) -> str:
         return self._current
 
     @property
@@ -108,28 +103,58 @@ class Source(str):
         Increments the parser if the end of the input has not been reached.
         Returns whether or not it was able to advance.
         """
-        try:
-            self._idx, self._current = next(self._chars)
-
-            return True
-        except StopIteration:
-            self._idx = len(self)
-            self._current = self.EOF
-            if exception:
-                raise self.parse_error(exception)
-
-            return False
+        return self.inc_n(1, exception=exception)
 
     def inc_n(self, n: int, exception: Exception = None) -> bool:
         """
         Increments the parser by n characters
         if the end of the input has not been reached.
         """
-        for _ in range(n):
-            if not self.inc(exception=exception):
-                return False
+        if self._seek(self._idx + n):
+            return True
+
+        if exception:
+            raise self.parse_error(exception)
 
-        return True
+        return False
+
+    def skip(self, pattern: Pattern[str]) -> bool:
+        """
+        Moves past the run of characters matched by pattern at the current
+        position, in a single step.
+        Returns False if the end of the input has been reached.
+        """
+        return self._seek(pattern.match(self, self._idx).end())
+
+    def _seek(self, idx: int) -> bool:
+        if idx < len(self):
+            self._idx = idx
+            self._current = self[idx]
+
+            return True
+
+        self._idx = len(self)
+        self._current = self.EOF
+
+        return False
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """
+        Returns the current (index, marker) pair, to be handed to rollback().
+        """
+        return self._idx, self._marker
+
+    def rollback(
+        self, checkpoint: Tuple[int, int], restore_marker: bool = True
+    ) -> None:
+        """
+        Moves the parser back to a position saved with checkpoint().
+        """
+        idx, marker = checkpoint
+        self._seek(idx)
+
+        if restore_marker:
+            self._marker = marker
 
     def consume(self, chars, min=0, max=-1):
         """
@@ -149,7 +174,7 @@ class Source(str):
         """
         Returns True if the parser has reached the end of the input.
         """
-        return self._current is self.EOF
+        return self._idx >= len(self)
 
     def mark(self) -> None:
         """
@@ -162,17 +187,29 @@ class Source(str):
     ) -> ParseError:
         """
         Creates a generic "parse error" at the current position.
+        The line and column are resolved lazily.
         """
-        line, col = self._to_linecol()
+        return exception(None, None, *args)._locate(self, self._idx)
+
+    def _to_linecol(self, idx: Optional[int] = None) -> Tuple[int, int]:
+        if idx is None:
+            idx = self._idx
+
+        line_ends = self._get_line_ends()
+        line = bisect_right(line_ends, idx)
+        if line == len(line_ends):
+            return len(line_ends), 0
 
-        return exception(line, col, *args)
+        line_start = line_ends[line - 1] if line else 0
 
-    def _to_linecol(self) -> Tuple[int, int]:
-        cur = 0
-        for i, line in enumerate(self.splitlines()):
-            if cur + len(line) + 1 > self.idx:
-                return (i + 1, self.idx - cur)
+        return line + 1, idx - line_start
 
-            cur += len(line) + 1
+    def _get_line_ends(self) -> List[int]:
+        if self._line_ends is None:
+            lines = self.splitlines(keepends=True)
+            self._line_ends = list(accumulate(len(line) for line in lines))
+            if lines and lines[-1].splitlines()[0] == lines[-1]:
+                # The end of the input belongs to an unterminated last line
+                self._line_ends[-1] += 1
 
-        return len(self.splitlines()), 0
+        return self._line_ends
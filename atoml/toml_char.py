@@ -1,7 +1,5 @@
 import string
 
-from functools import lru_cache
-
 
 class TOMLChar(str):
     def __init__(self, c):
@@ -17,44 +15,48 @@ class TOMLChar(str):
     NL = "\n\r"
     WS = SPACES + NL
 
-    @lru_cache(maxsize=None)
     def is_bare_key_char(self) -> bool:
         """
         Whether the character is a valid bare key name or not.
         """
-        return self in self.BARE
+        return self in BARE_CHARS
 
-    @lru_cache(maxsize=None)
     def is_kv_sep(self) -> bool:
         """
         Whether the character is a valid key/value separator ot not.
         """
-        return self in self.KV
+        return self in KV_CHARS
 
-    @lru_cache(maxsize=None)
     def is_int_float_char(self) -> bool:
         """
         Whether the character if a valid integer or float value character or not.
         """
-        return self in self.NUMBER
+        return self in NUMBER_CHARS
 
-    @lru_cache(maxsize=None)
     def is_ws(self) -> bool:
         """
         Whether the character is a whitespace character or not.
         """
-        return self in self.WS
+        return self in WS_CHARS
 
-    @lru_cache(maxsize=None)
     def is_nl(self) -> bool:
         """
         Whether the character is a new line character or not.
         """
-        return self in self.NL
+        return self in NL_CHARS
 
-    @lru_cache(maxsize=None)
     def is_spaces(self) -> bool:
         """
         Whether the character is a space or not
         """
-        return self in self.SPACES
+        return self in SPACES_CHARS
+
+
+# Character classes for membership tests on plain ``str`` characters.
+# The parser uses these directly in its hot loops.
+BARE_CHARS = frozenset(TOMLChar.BARE)
+KV_CHARS = frozenset(TOMLChar.KV)
+NUMBER_CHARS = frozenset(TOMLChar.NUMBER)
+SPACES_CHARS = frozenset(TOMLChar.SPACES)
+NL_CHARS = frozenset(TOMLChar.NL)
+WS_CHARS = frozenset(TOMLChar.WS)
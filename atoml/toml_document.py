@@ -1,7 +1,50 @@
-from .container import Container
+from typing import IO, Optional, Tuple
+
+from .container import _WRITE_CHUNK_SIZE, Container
 
 
 class TOMLDocument(Container):
     """
     A TOML document.
     """
+
+    # Text the document was parsed from and the version of the document it
+    # was parsed into: until the document changes, the text is output as is
+    _source: Optional[Tuple[int, str]] = None
+
+    def _unchanged_source(self) -> Optional[str]:
+        if self._source is None:
+            return None
+
+        version, source = self._source
+        if version != self._version:
+            self._source = None
+
+            return None
+
+        return source
+
+    def __copy__(self) -> "TOMLDocument":
+        c = super().__copy__()
+        source = self._unchanged_source()
+        if source is not None:
+            c._source = (c._version, source)
+
+        return c
+
+    def as_string(self) -> str:
+        source = self._unchanged_source()
+        if source is not None:
+            return source
+
+        return super().as_string()
+
+    def write_to(self, fp: IO[str]) -> None:
+        source = self._unchanged_source()
+        if source is None:
+            super().write_to(fp)
+
+            return
+
+        for start in range(0, len(source), _WRITE_CHUNK_SIZE):
+            fp.write(source[start : start + _WRITE_CHUNK_SIZE])
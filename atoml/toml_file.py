@@ -1,3 +1,8 @@
+import os
+import tempfile
+
+from typing import Optional
+
 from .api import loads
 from .toml_document import TOMLDocument
 
@@ -15,5 +20,65 @@ class TOMLFile:
             return loads(f.read())
 
     def write(self, data: TOMLDocument) -> None:
-        with open(self._path, "w", encoding="utf-8") as f:
-            f.write(data.as_string())
+        """
+        Writes the document to the file.
+
+        The document is rendered into a temporary file next to it, which then
+        replaces the file: if rendering fails, the file is left untouched.
+        A new file only gets the permissions allowed by the umask where it
+        can be read (on Linux), and is private to the owner otherwise.
+        """
+        path = os.path.realpath(self._path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}."
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                write_to = getattr(data, "write_to", None)
+                if write_to is not None:
+                    write_to(f)
+                else:
+                    f.write(data.as_string())
+
+            mode = _file_mode(path)
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+
+            raise
+
+
+def _file_mode(path: str) -> Optional[int]:
+    """
+    Returns the permissions of the file, or those of a new file
+    if it does not exist and the umask can be read.
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        pass
+
+    umask = _umask()
+    if umask is None:
+        return None
+
+    return 0o666 & ~umask
+
+
+def _umask() -> Optional[int]:
+    """
+    Returns the umask of the process if it can be read without changing it,
+    which os.umask() cannot do safely while other threads create files.
+    """
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+
+    return None
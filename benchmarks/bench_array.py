@@ -0,0 +1,45 @@
+"""
+Measures parsing of a single large array.
+
+Lock files contain long arrays such as lists of hashes, so the cost per
+element matters more than the cost of the surrounding document.
+
+Usage::
+
+    python benchmarks/bench_array.py
+"""
+import timeit
+
+import atoml
+
+
+ELEMENTS = 100_000
+REPEAT = 3
+
+
+def make_int_array(n: int) -> str:
+    return "a = [{}]\n".format(", ".join(str(i) for i in range(n)))
+
+
+def make_hash_array(n: int) -> str:
+    lines = "".join(f'    "sha256:{i:064x}",\n' for i in range(n))
+
+    return f"hashes = [\n{lines}]\n"
+
+
+def bench(content: str) -> float:
+    return min(timeit.repeat(lambda: atoml.parse(content), number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    for name, content in [
+        ("integers", make_int_array(ELEMENTS)),
+        ("hashes", make_hash_array(ELEMENTS)),
+    ]:
+        elapsed = bench(content)
+        per_element = elapsed / ELEMENTS * 1e6
+        print(f"{name:>10}: {elapsed:.3f}s ({per_element:.2f}us per element)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures inserting many keys into a single table.
+
+The positional inserts go after the last value of a table that is followed
+by sub-tables, so every insertion lands in the middle of the container.
+The appends build a table from scratch, like ``atoml.item(dict)`` does
+for ``dumps``, and the churn sets and deletes the same keys over and over.
+The reads look up a super-table split by another table, which goes through
+an out-of-order table proxy.
+
+Usage::
+
+    python benchmarks/bench_container.py
+"""
+import time
+
+import atoml
+
+
+KEYS = 50_000
+APPENDED_KEYS = 100_000
+CHURN_KEYS = 1_000
+CHURN_ROUNDS = 100
+PROXY_KEYS = 1_000
+PROXY_READS = 10_000
+
+
+def make_table() -> atoml.items.Table:
+    doc = atoml.parse("[tool]\nkey0 = 0\n\n[tool.a]\nx = 1\n\n[tool.b]\ny = 2\n")
+    doc.parsing(False)
+
+    return doc["tool"]
+
+
+def bench_insert_after(n: int) -> float:
+    container = make_table().value
+    start = time.perf_counter()
+    for i in range(1, n):
+        container._insert_after(f"key{i - 1}", f"key{i}", i)
+
+    return time.perf_counter() - start
+
+
+def bench_append(n: int) -> float:
+    table = atoml.table()
+    table.append("sub", atoml.table())
+    start = time.perf_counter()
+    for i in range(n):
+        table[f"key{i}"] = i
+
+    return time.perf_counter() - start
+
+
+def bench_item(n: int) -> float:
+    data = {f"key{i}": i for i in range(n)}
+    start = time.perf_counter()
+    atoml.item(data)
+
+    return time.perf_counter() - start
+
+
+def bench_churn(n: int) -> float:
+    table = atoml.table()
+    for i in range(n):
+        table[f"key{i}"] = i
+
+    start = time.perf_counter()
+    for _ in range(CHURN_ROUNDS):
+        for i in range(0, n, 2):
+            del table[f"key{i}"]
+
+        for i in range(0, n, 2):
+            table[f"key{i}"] = i
+
+    return time.perf_counter() - start
+
+
+def bench_out_of_order_reads(n: int) -> float:
+    keys = "".join(f"key{i} = {i}\n" for i in range(n))
+    doc = atoml.parse(f"[tool.x.a]\n{keys}\n[other]\n\n[tool.x.b]\n{keys}")
+    start = time.perf_counter()
+    for _ in range(PROXY_READS):
+        doc["tool"]["x"]
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for name, func, n, operations in [
+        ("insert after", bench_insert_after, KEYS, KEYS),
+        ("append", bench_append, APPENDED_KEYS, APPENDED_KEYS),
+        ("item(dict)", bench_item, APPENDED_KEYS, APPENDED_KEYS),
+        ("churn", bench_churn, CHURN_KEYS, CHURN_KEYS * CHURN_ROUNDS),
+        ("proxy reads", bench_out_of_order_reads, PROXY_KEYS, PROXY_READS),
+    ]:
+        elapsed = func(n)
+        per_operation = elapsed / operations * 1e6
+        print(f"{name:>12}: {elapsed:.3f}s ({per_operation:.2f}us per operation)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measures the memory held by parsed documents, per key/value pair.
+
+A style-preserving document keeps an item, a key and a trivia object
+for every key/value pair, so their layout drives the memory footprint
+of large files such as lock files.
+
+Usage::
+
+    python benchmarks/bench_memory.py
+"""
+import gc
+import os
+import tracemalloc
+
+from typing import Any
+
+from run import make_document
+
+import atoml
+
+from atoml.items import AoT, Array, InlineTable, Table
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KB = 1024
+
+
+def count_pairs(container: Any) -> int:
+    """
+    Counts the key/value pairs of a container, the nested ones included.
+    """
+    count = 0
+    for key, item in container.body:
+        if isinstance(item, (Table, InlineTable)):
+            count += count_pairs(item.value)
+        elif isinstance(item, AoT):
+            count += sum(count_pairs(table.value) for table in item.body)
+        elif key is not None:
+            count += 1
+            if isinstance(item, Array):
+                count += sum(
+                    count_pairs(value.value)
+                    for value in item._value
+                    if isinstance(value, InlineTable)
+                )
+
+    return count
+
+
+def measure(document: str) -> float:
+    """
+    Returns the number of bytes allocated by parsing the document
+    and still held by it, per key/value pair.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        doc = atoml.parse(document)
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    return held / count_pairs(doc)
+
+
+def main() -> None:
+    with open(os.path.join(ROOT, "pdm.lock"), encoding="utf-8") as f:
+        lock = f.read()
+
+    cases = [("pdm.lock", lock)] + [
+        (f"synthetic-{size // KB}KB", make_document(size))
+        for size in [10 * KB, 100 * KB]
+    ]
+    for name, document in cases:
+        print(f"{name:>16}: {measure(document):.0f} bytes per key/value")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measures the cost of saving and restoring the parser state.
+
+The parser enters ``Source.state`` for every item, string and peek, so the
+cost of a checkpoint is paid several times per line of input. It should not
+depend on the size of the document being parsed.
+
+Usage::
+
+    python benchmarks/bench_state.py
+"""
+import timeit
+
+from atoml.parser import Parser
+
+
+SIZES = [1_000, 100_000, 1_000_000]
+NUMBER = 100_000
+
+
+def make_source(size: int) -> str:
+    line = 'key = "value"\n'
+
+    return line * (size // len(line))
+
+
+def bench_checkpoint(size: int) -> float:
+    parser = Parser(make_source(size))
+    parser.inc_n(size // 2)
+
+    def save_only():
+        with parser._state:
+            pass
+
+    return timeit.timeit(save_only, number=NUMBER) / NUMBER
+
+
+def bench_rollback(size: int) -> float:
+    parser = Parser(make_source(size))
+    parser.inc_n(size // 2)
+
+    def save_and_restore():
+        with parser._state(save_marker=True, restore=True):
+            pass
+
+    return timeit.timeit(save_and_restore, number=NUMBER) / NUMBER
+
+
+def main() -> None:
+    print(f"{'size':>10} {'save (ns)':>12} {'save+restore (ns)':>18}")
+    for size in SIZES:
+        save = bench_checkpoint(size) * 1e9
+        restore = bench_rollback(size) * 1e9
+        print(f"{size:>10} {save:>12.0f} {restore:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compares the style-preserving parser with the values-only mode.
+
+Callers that only read configuration never touch trivia, comments or the
+original formatting, so ``preserve=False`` skips building items for them.
+
+Usage::
+
+    python benchmarks/bench_values.py
+"""
+import os
+import timeit
+
+from typing import List
+
+import atoml
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+# Nested a thousand levels deep, these exceed the preserving parser's recursion
+IGNORED = {"qa-array-inline-nested-1000.toml", "qa-table-inline-nested-1000.toml"}
+
+
+def read_corpus(*parts: str) -> List[str]:
+    """
+    Reads every document of a test corpus, or none if it is not checked out.
+    """
+    directory = os.path.join(ROOT, *parts)
+    if not os.path.isdir(directory):
+        return []
+
+    documents = []
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if not filename.endswith(".toml") or filename in IGNORED:
+                continue
+
+            with open(os.path.join(dirpath, filename), encoding="utf-8") as f:
+                documents.append(f.read())
+
+    return documents
+
+
+def bench(documents, preserve: bool) -> float:
+    def run():
+        for document in documents:
+            atoml.parse(document, preserve=preserve)
+
+    return min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    with open(os.path.join(ROOT, "pdm.lock"), encoding="utf-8") as f:
+        lock = f.read()
+
+    cases = [
+        ("pdm.lock", [lock]),
+        ("toml-spec-tests", read_corpus("tests", "toml-spec-tests", "values")),
+        ("toml-test", read_corpus("tests", "toml-test", "tests", "valid")),
+    ]
+    for name, documents in cases:
+        if not documents:
+            print(f"{name:>16}: skipped (corpus not available)")
+            continue
+
+        preserving = bench(documents, preserve=True)
+        plain = bench(documents, preserve=False)
+        print(
+            f"{name:>16}: preserve {preserving * 1e3:.1f}ms, "
+            f"values {plain * 1e3:.1f}ms ({preserving / plain:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
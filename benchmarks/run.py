@@ -0,0 +1,434 @@
+"""
+Runs the standing benchmark suite and emits the results as JSON.
+
+Every workload is timed over the same inputs:
+
+* the vendored toml-spec-tests and toml-test corpora, when checked out;
+* this repository's ``pdm.lock``;
+* synthetic lock files scaled from 1 KB to 50 MB.
+
+``dumps`` and ``TOMLFile.write`` render copies of the parsed documents in
+full, as parsed documents output their source text as is until they change.
+``dumps[source]`` times that shortcut on freshly parsed documents.
+``Container.value`` is read as is and after setting a top-level key,
+and so is ``dumps`` on the document it has already rendered.
+The edit workloads (``Container.append``/``remove``, ``Array.insert``/``pop``
+and the ``extend`` of arrays) are timed over a fixed number of keys and
+elements instead.
+Nothing is fetched from the network.
+
+Usage::
+
+    python benchmarks/run.py -o before.json
+    python benchmarks/run.py -o after.json --compare before.json
+
+``--max-size`` skips the synthetic documents above a given size, e.g.
+``--max-size 1MB`` for a quick run. ``-k`` runs only the benchmarks whose
+name contains a string, e.g. ``-k AoT.extend``, and only builds their inputs.
+"""
+import argparse
+import copy
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import atoml  # noqa: E402
+
+from atoml.toml_file import TOMLFile  # noqa: E402
+
+
+KB = 1024
+MB = 1024 * KB
+SIZES = [KB, 10 * KB, 100 * KB, MB, 10 * MB, 50 * MB]
+EDIT_COUNTS = [1_000, 10_000]
+# Minimum wall time spent on each measurement, and its bounds in runs
+MIN_TIME = 0.2
+MIN_REPEAT = 1
+MAX_REPEAT = 20
+# Workloads timed on every document input and on the edit counts, by name
+DOCUMENT_BENCHMARKS = [
+    "parse",
+    "dumps",
+    "dumps[source]",
+    "TOMLFile.read",
+    "TOMLFile.write",
+    "Container.value",
+    "Container.value[edited]",
+    "dumps[edited]",
+]
+EDIT_BENCHMARKS = [
+    "Container.append",
+    "Container.remove",
+    "Array.insert[end]",
+    "Array.insert[0]",
+    "Array.pop",
+    "Array.extend",
+    "AoT.extend",
+]
+# Nested a thousand levels deep, these exceed the parser's recursion limit
+IGNORED = {"qa-array-inline-nested-1000.toml", "qa-table-inline-nested-1000.toml"}
+
+
+def measure(func: Callable[[], Any], setup: Callable[[], Any] = None) -> Dict:
+    """
+    Times func until MIN_TIME has elapsed and returns the best and median run.
+    setup is called before each run and its result passed to func,
+    outside the timed region.
+    """
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < MAX_REPEAT:
+        if setup is None:
+            start = time.perf_counter()
+            func()
+        else:
+            arg = setup()
+            start = time.perf_counter()
+            func(arg)
+
+        timings.append(time.perf_counter() - start)
+
+        if len(timings) >= MIN_REPEAT and time.perf_counter() - started > MIN_TIME:
+            break
+
+    timings.sort()
+
+    return {
+        "best": timings[0],
+        "median": timings[len(timings) // 2],
+        "runs": len(timings),
+    }
+
+
+def read_corpus(*parts: str) -> List[str]:
+    """
+    Reads every valid document of a test corpus, or none if it is not checked out.
+    """
+    directory = os.path.join(ROOT, *parts)
+    documents = []
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if not filename.endswith(".toml") or filename in IGNORED:
+                continue
+
+            with open(os.path.join(dirpath, filename), encoding="utf-8") as f:
+                documents.append(f.read())
+
+    return documents
+
+
+def make_package(i: int) -> str:
+    hashes = "".join(
+        f'    {{file = "pkg{i}-{j}.whl", hash = "sha256:{i * 8 + j:064x}"}},\n'
+        for j in range(4)
+    )
+
+    return (
+        "[[package]]\n"
+        f'name = "package-{i}"\n'
+        f'version = "{i % 10}.{i % 7}.{i % 3}"\n'
+        'requires_python = ">=3.6"  # minimum supported version\n'
+        f'summary = "Synthetic package number {i}"\n'
+        f"downloads = {i * 37}\n"
+        f"score = {i / 7:.4f}\n"
+        f"released = 2021-{i % 12 + 1:02d}-{i % 28 + 1:02d}T12:00:00Z\n"
+        f"yanked = {'true' if i % 11 == 0 else 'false'}\n"
+        f'dependencies = ["package-{i + 1}", "package-{i + 2}"]\n'
+        "\n"
+        f'[metadata.files."package-{i} {i % 10}.0"]\n'
+        f"files = [\n{hashes}]\n"
+        "\n"
+    )
+
+
+def make_document(size: int) -> str:
+    """
+    Builds a lock-file-like document of at least size characters.
+    """
+    header = '# Synthetic lock file\n\n[metadata]\nlock_version = "3.1"\n\n'
+    chunks = [header]
+    length = len(header)
+    i = 0
+    while length < size:
+        package = make_package(i)
+        chunks.append(package)
+        length += len(package)
+        i += 1
+
+    return "".join(chunks)
+
+
+def format_size(size: int) -> str:
+    if size >= MB:
+        return f"{size // MB}MB"
+
+    return f"{size // KB}KB"
+
+
+def parse_size(value: str) -> int:
+    value = value.upper()
+    for suffix, factor in [("MB", MB), ("KB", KB)]:
+        if value.endswith(suffix):
+            return int(value[: -len(suffix)]) * factor
+
+    return int(value)
+
+
+def document_inputs(max_size: Optional[int]) -> Iterator[Tuple[str, List[str]]]:
+    for name, parts in [
+        ("toml-spec-tests", ("tests", "toml-spec-tests", "values")),
+        ("toml-test", ("tests", "toml-test", "tests", "valid")),
+    ]:
+        documents = read_corpus(*parts)
+        if documents:
+            yield name, documents
+
+    with open(os.path.join(ROOT, "pdm.lock"), encoding="utf-8") as f:
+        yield "pdm.lock", [f.read()]
+
+    for size in SIZES:
+        if max_size is None or size <= max_size:
+            yield f"synthetic-{format_size(size)}", [make_document(size)]
+
+
+# (benchmark, input, size, func, setup), see measure() for func and setup
+Case = Tuple[str, str, int, Callable, Optional[Callable[[], Any]]]
+
+
+def bench_documents(name: str, documents: List[str]) -> Iterator[Case]:
+    size = sum(len(document) for document in documents)
+    parsed = [atoml.parse(document) for document in documents]
+
+    def parse():
+        for document in documents:
+            atoml.parse(document)
+
+    def unchanged():
+        return [atoml.parse(document) for document in documents]
+
+    def unrendered():
+        # Parsed documents output their source as is until they change, and
+        # the text of their entries otherwise. Their copies keep neither,
+        # so they are used for the workloads measuring a full rendering
+        return [copy.deepcopy(doc) for doc in parsed]
+
+    def dumps(docs):
+        for doc in docs:
+            atoml.dumps(doc)
+
+    def value():
+        for doc in parsed:
+            doc.value
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i, doc in enumerate(parsed):
+            toml_file = TOMLFile(os.path.join(tmp, f"{i}.toml"))
+            toml_file.write(doc)
+            files.append(toml_file)
+
+        def read():
+            for toml_file in files:
+                toml_file.read()
+
+        def write(docs):
+            for toml_file, doc in zip(files, docs):
+                toml_file.write(doc)
+
+        for benchmark, func, setup in [
+            ("parse", parse, None),
+            ("dumps", dumps, unrendered),
+            ("dumps[source]", dumps, unchanged),
+            ("TOMLFile.read", read, None),
+            ("TOMLFile.write", write, unrendered),
+            ("Container.value", value, None),
+        ]:
+            yield benchmark, name, size, func, setup
+
+    def edit_and_value():
+        for doc in parsed:
+            # Mutates the document, so it runs after the other workloads
+            doc["__bench__"] = 0
+            doc.value
+
+    def edit_and_dumps():
+        for doc in parsed:
+            # Only the edited entries are rendered again
+            doc["__bench__"] = 0
+            atoml.dumps(doc)
+
+    yield "Container.value[edited]", name, size, edit_and_value, None
+    yield "dumps[edited]", name, size, edit_and_dumps, None
+
+
+def bench_edits(count: int) -> Iterator[Case]:
+    def fill():
+        doc = atoml.document()
+        for i in range(count):
+            doc.append(f"key{i}", i)
+
+        return doc
+
+    def append(_):
+        fill()
+
+    def remove(doc):
+        for i in range(count):
+            doc.remove(f"key{i}")
+
+    def array_append(array):
+        for i in range(count):
+            array.insert(len(array), i)
+
+    def array_prepend(array):
+        for i in range(count):
+            array.insert(0, i)
+
+    def array_pop(array):
+        for _ in range(count):
+            array.pop()
+
+    def array_extend(array):
+        array.extend(range(count))
+
+    def packages():
+        doc = atoml.document()
+        doc.append("package", atoml.aot())
+        tables = [
+            atoml.item({"name": f"package-{i}", "version": "1.0"}) for i in range(count)
+        ]
+
+        return doc["package"], tables
+
+    def aot_extend(args):
+        aot, tables = args
+        aot.extend(tables)
+
+    for benchmark, func, setup in [
+        ("Container.append", append, lambda: None),
+        ("Container.remove", remove, fill),
+        ("Array.insert[end]", array_append, atoml.array),
+        ("Array.insert[0]", array_prepend, atoml.array),
+        ("Array.pop", array_pop, lambda: atoml.item(list(range(count)))),
+        ("Array.extend", array_extend, atoml.array),
+        ("AoT.extend", aot_extend, packages),
+    ]:
+        yield benchmark, f"{count} items", count, func, setup
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(max_size: Optional[int], only: Optional[str]) -> Dict:
+    def selected(benchmarks: List[str]) -> bool:
+        return only is None or any(only in benchmark for benchmark in benchmarks)
+
+    results = []
+    # The inputs are only built, and the documents parsed,
+    # when one of the benchmarks run on them is selected
+    cases = itertools.chain(
+        itertools.chain.from_iterable(
+            bench_documents(name, documents)
+            for name, documents in (
+                document_inputs(max_size) if selected(DOCUMENT_BENCHMARKS) else []
+            )
+        ),
+        itertools.chain.from_iterable(
+            bench_edits(count) for count in EDIT_COUNTS if selected(EDIT_BENCHMARKS)
+        ),
+    )
+    for benchmark, input_name, size, func, setup in cases:
+        if only is not None and only not in benchmark:
+            continue
+
+        result = {
+            "benchmark": benchmark,
+            "input": input_name,
+            "size": size,
+            **measure(func, setup),
+        }
+        results.append(result)
+        print(
+            f"{benchmark:>24} {input_name:>18}: "
+            f"{result['best'] * 1e3:10.2f}ms ({result['runs']} runs)",
+            file=sys.stderr,
+        )
+
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict) -> None:
+    """
+    Prints the ratio between the best timings of two runs.
+    """
+    before = {(r["benchmark"], r["input"]): r["best"] for r in baseline["results"]}
+    print(f"{baseline['revision']} -> {current['revision']}", file=sys.stderr)
+    for result in current["results"]:
+        key = (result["benchmark"], result["input"])
+        if key not in before:
+            continue
+
+        ratio = result["best"] / before[key]
+        print(
+            f"{result['benchmark']:>24} {result['input']:>18}: {ratio:6.2f}x",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "-o", "--output", help="write the JSON results to this file instead of stdout"
+    )
+    parser.add_argument(
+        "--max-size",
+        type=parse_size,
+        help="skip synthetic documents larger than this, e.g. 1MB",
+    )
+    parser.add_argument("-k", "--only", help="run only benchmarks matching this name")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    args = parser.parse_args()
+
+    results = run(args.max_size, args.only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
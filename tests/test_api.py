@@ -1,6 +1,7 @@
 import io
 import json
 import os
+import pickle
 
 from datetime import date, datetime, time
 from types import MappingProxyType
@@ -29,8 +30,10 @@ from atoml.items import (
     InlineTable,
     Integer,
     Key,
+    String,
     Table,
     Time,
+    Whitespace,
 )
 from atoml.toml_document import TOMLDocument
 
@@ -98,6 +101,173 @@ def test_parsed_document_are_properly_json_representable(
     assert doc == json_doc
 
 
+@pytest.mark.parametrize("example_name", ["0.5.0", "pyproject", "table_names"])
+def test_values_only_parse_returns_plain_values(example, json_example, example_name):
+    data = parse(example(example_name), preserve=False)
+    doc = json.loads(json.dumps(data, default=json_serial))
+    json_doc = json.loads(json_example(example_name))
+
+    assert type(data) is dict
+    assert doc == json_doc
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "test",
+        "newline_in_strings",
+        "preserve_quotes_in_string",
+        "string_slash_whitespace_newline",
+        "table_names",
+    ],
+)
+def test_values_only_parse_matches_the_document(example, example_name):
+    content = example(example_name)
+
+    assert loads(content, preserve=False) == loads(content)
+
+
+def test_values_only_parse_unwraps_scalars():
+    data = loads(
+        """a = "foo"
+b = 1
+c = [1.5, true, 1979-05-27T07:32:00Z]
+d = {e = 1979-05-27, f = 07:32:00}
+g = [-1.5e3, 'bar', 1979-05-27 07:32:00]
+""",
+        preserve=False,
+    )
+
+    assert [type(v) for v in (data["a"], data["b"])] == [str, int]
+    assert data["g"] == [-1500.0, "bar", datetime(1979, 5, 27, 7, 32)]
+    assert [type(v) for v in data["g"]] == [float, str, datetime]
+    assert [type(v) for v in data["c"]] == [float, bool, datetime]
+    assert type(data["d"]["e"]) is date
+    assert type(data["d"]["f"]) is time
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "test",
+        "newline_in_strings",
+        "preserve_quotes_in_string",
+        "string_slash_whitespace_newline",
+        "table_names",
+    ],
+)
+def test_lazy_parse_matches_the_document(example, example_name):
+    content = example(example_name)
+    doc = loads(content, lazy=True)
+
+    assert doc == loads(content)
+    assert doc.as_string() == content
+
+
+def test_lazy_parse_converts_values_when_they_are_read():
+    content = """a = "foo\\tbar" # comment
+b = -1_000
+c = 1979-05-27T07:32:00Z
+d = inf
+
+[e]
+f = 'literal'
+"""
+    doc = parse(content, lazy=True)
+    eager = parse(content)
+
+    for key in ["a", "b", "c", "d"]:
+        assert isinstance(doc[key], type(eager[key]))
+        assert doc[key] == eager[key]
+        assert doc[key].trivia.comment == eager[key].trivia.comment
+
+    assert doc["e"]["f"] == "literal"
+
+    doc["b"] = 2
+    doc["e"]["g"] = doc["c"]
+    doc["a"].trivia.comment = "# changed"
+
+    assert doc.as_string() == content.replace("-1_000", "2").replace(
+        "# comment", "# changed"
+    ).replace("'literal'\n", "'literal'\ng = 1979-05-27T07:32:00Z\n")
+
+
+def test_lazy_parse_exposes_parsed_items_only():
+    content = """a = 1
+b = "foo"
+
+[t]
+c = 1979-05-27T07:32:00Z
+d = {e = 2.5}
+"""
+    doc = parse(content, lazy=True)
+    doc["b"] = "bar"
+
+    assert doc.as_string() == content.replace('"foo"', '"bar"')
+
+    items = [v for _, v in doc.body] + [v for _, v in doc["t"].value.body]
+
+    assert [type(v) for v in items] == [
+        Integer,
+        String,
+        Whitespace,
+        Table,
+        DateTime,
+        InlineTable,
+    ]
+    assert isinstance(dict.__getitem__(doc["t"], "c"), DateTime)
+
+    doc["a"] = 2
+    doc["t"]["c"] = 3
+
+    assert doc.as_string() == content.replace('"foo"', '"bar"').replace(
+        "a = 1", "a = 2"
+    ).replace("1979-05-27T07:32:00Z", "3")
+
+
+def test_lazy_parse_accepts_the_same_dates():
+    content = """odt4 = 179-05-27 07:32:00Z
+ld = 179-05-27 # comment
+"""
+    doc = parse(content, lazy=True)
+
+    assert doc == parse(content)
+    assert doc.as_string() == content
+
+
+def test_lazy_parse_raises_errors_when_values_are_read():
+    doc = parse('a = 1__0\nb = "ok"\n', lazy=True)
+
+    assert doc["b"] == "ok"
+    with pytest.raises(InvalidNumberError):
+        doc["a"]
+
+    content = "x = 1\n\n[t]\n  a   =   12abc # comment\n"
+    with pytest.raises(InvalidNumberError) as eager:
+        parse(content)
+    with pytest.raises(InvalidNumberError) as lazy:
+        parse(content, lazy=True)["t"]["a"]
+
+    assert (lazy.value.line, lazy.value.col) == (4, 15)
+    assert lazy.value.args == eager.value.args
+
+    doc = pickle.loads(pickle.dumps(parse(content, lazy=True)))
+    with pytest.raises(InvalidNumberError) as copied:
+        doc["t"]["a"]
+
+    assert copied.value.args == eager.value.args
+
+
 @pytest.mark.parametrize(
     "example_name,error",
     [
@@ -126,6 +296,9 @@ def test_parse_raises_errors_for_invalid_toml_files(
     with pytest.raises(error):
         parse(invalid_example(example_name))
 
+    with pytest.raises(error):
+        parse(invalid_example(example_name), preserve=False)
+
 
 @pytest.mark.parametrize(
     "example_name",
@@ -170,6 +343,28 @@ def test_dump_to_file_object():
     assert fp.getvalue() == 'foo = "bar"\n'
 
 
+def test_dump_writes_large_documents_in_chunks():
+    doc = parse("".join(f'[table{i}]\nkey = "{"x" * 100}"\n\n' for i in range(2000)))
+
+    class Stream(io.StringIO):
+        writes = 0
+
+        def write(self, s):
+            self.writes += 1
+            return super().write(s)
+
+    fp = Stream()
+    dump(doc, fp)
+
+    assert fp.getvalue() == dumps(doc)
+    assert 1 < fp.writes < len(doc)
+
+
+def test_dump_weird_object():
+    with pytest.raises(TypeError):
+        dump(object(), io.StringIO())
+
+
 def test_integer():
     i = atoml.integer("34")
 
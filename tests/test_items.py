@@ -1,12 +1,13 @@
 import math
 import pickle
 
+from array import array as pyarray
 from datetime import date, datetime, time, timedelta
 
 import pytest
 
-from atoml import inline_table, parse
-from atoml.api import array, ws
+from atoml import inline_table, integer, parse
+from atoml.api import aot, array, ws
 from atoml.exceptions import NonExistentKey
 from atoml.items import (
     Bool,
@@ -177,6 +178,114 @@ def test_array_behaves_like_a_list():
     )
 
 
+def test_array_edits_shift_the_following_elements():
+    a = item([1, 2, 3])
+    for i in range(4, 7):
+        a.insert(0, i)
+    a.append(7)
+    del a[1]
+    a[-1] = 8
+    a.insert(2, 9)
+    a[3] = 0
+    assert a == [6, 4, 9, 0, 2, 3, 8]
+    assert parse(f"a = {a.as_string()}")["a"] == a
+
+    del a[-3:]
+    assert a == [6, 4, 9, 0]
+    del a[::2]
+    assert a == [4, 0]
+    assert a.as_string() == "[4, 0]"
+
+
+def test_array_extend_lays_out_like_append():
+    content = """a = [
+    1, # comment
+]
+"""
+    for values in ([2, 3, 4], [2, ws(" "), 3]):
+        appended = parse(content)
+        for value in values:
+            appended["a"].append(value)
+        extended = parse(content)
+        extended["a"].extend(values)
+
+        assert extended["a"] == appended["a"]
+        assert extended.as_string() == appended.as_string()
+
+    a = item([1])
+    a += [2, 3]
+    assert a.as_string() == "[1, 2, 3]"
+
+
+def test_aot_extend_lays_out_like_append():
+    doc = parse("")
+    doc["p"] = aot()
+    doc["p"].append(item({"name": "a"}))
+    doc.as_string()
+    tables = [item({"name": "b"}), item({"name": "c"})]
+
+    doc["p"].extend(tables)
+    assert doc["p"][1] is tables[0]
+    assert (
+        doc.as_string()
+        == """[[p]]
+name = "a"
+
+[[p]]
+name = "b"
+
+[[p]]
+name = "c"
+"""
+    )
+
+    with pytest.raises(ValueError):
+        doc["p"].extend([1])
+    assert len(doc["p"]) == 3
+
+
+def test_array_of_packed_numbers():
+    a = item(pyarray("d", [0.5, 1.0, float("inf")]))
+
+    assert a == [0.5, 1.0, float("inf")]
+    assert a.as_string() == item([0.5, 1.0, float("inf")]).as_string()
+    assert memoryview(a.to_buffer()).format == "d"
+
+    a.append(2.5)
+    assert a.as_string() == "[0.5, 1.0, inf, 2.5]"
+    assert a.to_buffer() == pyarray("d", [0.5, 1.0, float("inf"), 2.5])
+
+
+def test_array_to_buffer_requires_homogeneous_numbers():
+    doc = parse("a = [1, 2]\nb = [1, 2.0]\nc = [true]\n")
+
+    assert doc["a"].to_buffer() == pyarray("q", [1, 2])
+    for key in "bc":
+        with pytest.raises(ValueError):
+            doc[key].to_buffer()
+
+
+def test_array_numpy_conversions():
+    np = pytest.importorskip("numpy")
+
+    a = item(np.arange(3))
+    assert a == [0, 1, 2]
+    assert a.as_string() == "[0, 1, 2]"
+    assert a.to_numpy().tolist() == [0, 1, 2]
+    assert item(np.ones((2, 2))).as_string() == "[[1.0, 1.0], [1.0, 1.0]]"
+    assert parse("a = [0.5, 1.5]")["a"].to_numpy().dtype == np.float64
+
+    for dtype in [np.uint8, np.int16, np.int32, np.uint64, np.float32, np.float64]:
+        a = item(np.array([1, 2], dtype=dtype))
+        assert a.to_numpy().dtype == dtype
+        assert a.to_numpy().tolist() == [1, 2]
+
+    a = item(np.array([1.5, -2], dtype=">f8"))
+    assert a.to_numpy().dtype == np.float64
+    assert a.to_numpy().tolist() == [1.5, -2.0]
+    assert item(np.array([0.5], dtype=np.float16)).as_string() == "[0.5]"
+
+
 def test_array_multiline():
     t = item([1, 2, 3, 4, 5, 6, 7, 8])
     t.multiline(True)
@@ -600,6 +709,36 @@ def test_items_are_pickable():
     assert pickle.loads(s).as_string() == 'foo = "bar"\n'
 
 
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_keys_and_trivia_are_pickable(protocol):
+    key = Key("a.b", t=KeyType.Literal, sep="=", dotted=True)
+    loaded = pickle.loads(pickle.dumps(key, protocol))
+
+    assert loaded == key
+    assert loaded.as_string() == "'a.b'"
+    assert loaded.sep == "="
+    assert loaded.is_dotted()
+
+    trivia = Trivia(indent="  ", comment_ws=" ", comment="# c", trail="")
+    loaded = pickle.loads(pickle.dumps(trivia, protocol))
+
+    assert (loaded.indent, loaded.comment_ws, loaded.comment, loaded.trail) == (
+        "  ",
+        " ",
+        "# c",
+        "",
+    )
+
+
+def test_parsed_items_have_no_instance_dict():
+    doc = parse("a = true # c\nb = [1.5]\nc = 1979-05-27\n[d]\n[[e]]\n")
+
+    for key, value in doc.body:
+        assert not hasattr(key, "__dict__")
+        assert not hasattr(value, "__dict__")
+        assert not hasattr(value.trivia, "__dict__")
+
+
 def test_trim_comments_when_building_inline_table():
     table = inline_table()
     row = parse('foo = "bar"  # Comment')
@@ -650,3 +789,17 @@ value = false
 
     assert {"foo": {"value": False}} == content
     assert {"value": False} == content["foo"]
+
+
+def test_items_record_each_holder_once():
+    item = integer("1")
+    doc = parse("[t]\n")
+    for _ in range(3):
+        item._adopted_by(doc)
+        item._adopted_by(doc["t"].value)
+
+    owners = [ref() for ref in item.trivia._owners]
+
+    assert len(owners) == 2
+    assert owners[0] is doc
+    assert owners[1] is doc["t"].value
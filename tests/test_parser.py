@@ -1,11 +1,18 @@
+from datetime import date
+
 import pytest
 
+from atoml import parse
 from atoml.exceptions import (
     EmptyTableNameError,
     InternalParserError,
+    InvalidCharInStringError,
+    InvalidControlChar,
+    ParseError,
     UnexpectedCharError,
+    UnexpectedEofError,
 )
-from atoml.items import StringType
+from atoml.items import Float, Integer, StringType
 from atoml.parser import Parser
 
 
@@ -41,3 +48,196 @@ a {c = 1, d = 2}
     parser = Parser(content)
     with pytest.raises(UnexpectedCharError):
         parser.parse()
+
+
+def test_parser_should_report_the_position_of_errors_deep_in_the_document():
+    content = 'a = 1\n\n[foo]\nb = [1, 2]\nc = "bar"\nd = 1 2\n'
+    parser = Parser(content)
+
+    with pytest.raises(UnexpectedCharError) as e:
+        parser.parse()
+
+    assert e.value.line == 6
+    assert e.value.col == 6
+    assert str(e.value) == "Unexpected character: '2' at line 6 col 6"
+
+
+def test_parse_errors_can_be_built_with_an_explicit_position():
+    e = UnexpectedCharError(3, 4, "x")
+
+    assert e.line == 3
+    assert e.col == 4
+    assert str(e) == "Unexpected character: 'x' at line 3 col 4"
+
+
+def test_parser_should_keep_the_layout_of_arrays_of_numbers():
+    content = "a = [\n  1,2 ,\n  -3.5e2, +0.25 ,\n]\nb = [1, 1979-05-27]\n"
+    doc = Parser(content).parse()
+
+    assert doc["a"] == [1, 2, -350.0, 0.25]
+    assert [type(v) for v in doc["a"]] == [Integer, Integer, Float, Float]
+    assert doc["a"][3].as_string() == "+0.25"
+    doc["a"].append(4)
+    assert doc.as_string().startswith("a = [\n  1,2 ,\n  -3.5e2, +0.25 ,\n    4\n]\n")
+
+    assert Parser(content).parse_values() == {
+        "a": [1, 2, -350.0, 0.25],
+        "b": [1, date(1979, 5, 27)],
+    }
+
+    with pytest.raises(UnexpectedCharError):
+        Parser("a = [1,,2]").parse()
+
+
+def test_parse_errors_report_their_position_and_release_the_source():
+    with pytest.raises(UnexpectedCharError) as e:
+        parse("a = 1\nb = 2 3\n")
+
+    assert e.value._source is None
+    assert e.value.args == ("Unexpected character: '3' at line 2 col 6",)
+    assert repr(e.value) == (
+        "UnexpectedCharError(\"Unexpected character: '3' at line 2 col 6\")"
+    )
+
+
+def test_parse_errors_count_crlf_line_endings_as_one_break():
+    with pytest.raises(UnexpectedCharError) as e:
+        parse("a = 1\r\n\r\n[t]\r\nb = x\r\n")
+
+    assert (e.value.line, e.value.col) == (4, 4)
+
+
+@pytest.mark.parametrize(
+    "content,position",
+    [
+        ("a = 1 2", (1, 6)),
+        ("= 1", (1, 0)),
+        ('a = "foo', (1, 8)),
+        ("a = 1\nb", (2, 1)),
+        ("a = 1\r\nb = 2 3", (2, 6)),
+    ],
+)
+def test_parse_errors_are_located_from_the_cursor(content, position):
+    with pytest.raises(ParseError) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == position
+
+
+@pytest.mark.parametrize(
+    "content,position",
+    [
+        ("a = truex", (1, 8)),
+        ("a = nanx", (1, 4)),
+        ("a = 0x1g", (1, 8)),
+        ("a = +inf x", (1, 9)),
+        ("a = 1979-05-27 07:32:0", (1, 22)),
+        ("a = 1\r\nb = 1979-05-27T07:32:00Zx\r\n", (2, 25)),
+    ],
+)
+def test_parse_errors_are_located_after_rolling_back(content, position):
+    with pytest.raises(ParseError) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == position
+
+
+@pytest.mark.parametrize(
+    "content,position",
+    [
+        ("a = [1 2]", (1, 7)),
+        ("a = [1, 2,, 3]", (1, 10)),
+        ("a = [[1, 2], [3 4]]", (1, 16)),
+        ("a = [1, 2", (1, 9)),
+        ("a = [1,\r\n  x]", (2, 2)),
+        ("a = [\n  1, # c\n  2\n  3]", (4, 2)),
+    ],
+)
+def test_array_errors_are_located_at_the_offending_element(content, position):
+    with pytest.raises(UnexpectedCharError) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == position
+
+
+@pytest.mark.parametrize(
+    "content,value",
+    [
+        ("[ \"a\" . 'b c' ]\nx = 1\n", {"a": {"b c": {"x": 1}}}),
+        ("[a. b .c]\n", {"a": {"b": {"c": {}}}}),
+        ('[a\t.\t"b.c"]\n', {"a": {"b.c": {}}}),
+        ('[[ "a b" . c ]]\nx = 1\n', {"a b": {"c": [{"x": 1}]}}),
+        ("a\t=\t1\x0c", {"a": 1}),
+    ],
+)
+def test_parser_should_split_names_on_classified_characters(content, value):
+    doc = parse(content)
+
+    assert doc == value
+    assert doc.as_string() == content
+
+
+@pytest.mark.parametrize(
+    "content,position",
+    [
+        ('[a "b"]\n', (1, 6)),
+        ("[a b]\n", (1, 4)),
+        ("a b = 1\n", (1, 4)),
+        ("a.b\x00 = 1", (1, 3)),
+        ("a = 1\n\x00", (2, 0)),
+    ],
+)
+def test_parser_should_reject_misplaced_characters_in_names(content, position):
+    with pytest.raises(ParseError) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == position
+
+
+@pytest.mark.parametrize(
+    "content,position",
+    [
+        ("a = 1 \t x", (1, 8)),
+        ("abc!def = 1", (1, 3)),
+        ("a = 1 # bad\x01\n", (1, 11)),
+        ("a = 1\t\t#\tx\x7f", (1, 10)),
+        ("a = 1 # c\r\nb = 2 # d\x01", (2, 9)),
+        ("[ a . b ] x\n", (1, 10)),
+        ("[[ a ]] x", (1, 8)),
+        ("a = {  b = 1 , c = 2 x }", (1, 21)),
+    ],
+)
+def test_errors_are_located_past_skipped_runs(content, position):
+    with pytest.raises(ParseError) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == position
+
+
+@pytest.mark.parametrize("content", ['a = """abc""', 'a = """abc"', "a = '''abc''"])
+def test_strings_closed_partially_at_eof_raise_an_eof_error(content):
+    with pytest.raises(UnexpectedEofError) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == (1, len(content))
+
+
+@pytest.mark.parametrize(
+    "content,error,position",
+    [
+        ('a = "b\x01"', InvalidControlChar, (1, 6)),
+        ('a = "b\nc"', InvalidControlChar, (1, 6)),
+        ("a = 'b\x01'", InvalidControlChar, (1, 6)),
+        ('a = """b\x01"""', InvalidControlChar, (1, 8)),
+        ("a = '''\nb\x01'''", InvalidControlChar, (2, 1)),
+        ('a = """\r\nx\r\n\x02"""', InvalidControlChar, (3, 0)),
+        ('a = "b\\q"', InvalidCharInStringError, (1, 7)),
+        ('a = """\nline\\q"""', InvalidCharInStringError, (2, 5)),
+        ('a = """b""""""', InvalidCharInStringError, (1, 14)),
+    ],
+)
+def test_string_errors_are_located_at_the_offending_character(content, error, position):
+    with pytest.raises(error) as e:
+        parse(content)
+
+    assert (e.value.line, e.value.col) == position
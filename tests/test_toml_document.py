@@ -1,4 +1,5 @@
 import copy
+import io
 import json
 import pickle
 
@@ -888,3 +889,389 @@ def test_pop_add_whitespace_and_insert_table_work_togheter():
     assert out["d"] == 4
     assert "d" not in out["e"]
     assert text == dedent(expected)
+
+
+def test_inserting_values_before_out_of_order_tables_keeps_them_reachable():
+    content = """\
+x = 1
+
+[a.a]
+key = "value"
+
+[b]
+c = 1
+
+[a.b]
+d = 2
+"""
+    doc = parse(content)
+    doc.parsing(False)
+    doc["y"] = 2
+    doc["z"] = 3
+
+    assert doc["a"] == {"a": {"key": "value"}, "b": {"d": 2}}
+    assert doc["b"] == {"c": 1}
+
+    doc["a"]["a"]["key"] = "new_value"
+    del doc["b"]
+
+    expected = """\
+x = 1
+y = 2
+z = 3
+
+[a.a]
+key = "new_value"
+
+[a.b]
+d = 2
+"""
+
+    assert expected == doc.as_string()
+
+
+def test_values_are_inserted_before_tables_after_tables_are_removed_and_added():
+    doc = atoml.document()
+    doc["a"] = 1
+    doc["t"] = {"x": 1}
+    doc["b"] = 2
+    del doc["t"]
+    doc["c"] = 3
+    doc["u"] = {"y": 1}
+    doc["d"] = 4
+
+    expected = """\
+a = 1
+b = 2
+c = 3
+d = 4
+
+[u]
+y = 1
+"""
+
+    assert expected == doc.as_string()
+
+
+def test_compact_drops_removed_items():
+    content = """\
+a = 1
+b = 2
+c = 3
+
+[t]
+x = 1
+
+[u.v]
+y = 1
+
+[w]
+
+[u.z]
+y = 2
+"""
+    doc = parse(content)
+    del doc["b"]
+    del doc["t"]
+    doc["d"] = 4
+    expected = doc.as_string()
+    size = len(doc.body)
+
+    assert doc.compact() is doc
+    assert len(doc.body) < size
+    assert not any(k is None and isinstance(v, atoml.items.Null) for k, v in doc.body)
+    assert expected == doc.as_string()
+    assert doc["u"] == {"v": {"y": 1}, "z": {"y": 2}}
+
+    doc["u"]["v"]["y"] = 3
+    doc["e"] = 5
+
+    assert doc["u"] == {"v": {"y": 3}, "z": {"y": 2}}
+    assert doc["e"] == 5
+    assert "e = 5\n" in doc.as_string()
+
+
+def test_removed_items_do_not_accumulate():
+    doc = atoml.document()
+    doc["a"] = 1
+    for i in range(1000):
+        doc["b"] = i
+        del doc["b"]
+
+    assert len(doc.body) < 100
+    assert "a = 1\n" == doc.as_string()
+
+
+def test_value_is_updated_after_nested_changes():
+    content = """\
+[a.b]
+c = 1
+
+[[d]]
+e = 1
+
+[x]
+
+[a.f]
+g = 1
+"""
+    doc = parse(content)
+    value = doc.value
+
+    doc["a"]["b"]["c"] = 2
+    doc["d"].append(atoml.table().add("e", 2))
+
+    assert doc.value == {
+        "a": {"b": {"c": 2}, "f": {"g": 1}},
+        "d": [{"e": 1}, {"e": 2}],
+        "x": {},
+    }
+    assert value == {
+        "a": {"b": {"c": 1}, "f": {"g": 1}},
+        "d": [{"e": 1}],
+        "x": {},
+    }
+
+    doc["a"]["f"]["g"] = 3
+    del doc["d"][0]
+
+    assert doc.value == {
+        "a": {"b": {"c": 2}, "f": {"g": 3}},
+        "d": [{"e": 2}],
+        "x": {},
+    }
+    assert doc.copy().value == doc.value
+    assert pickle.loads(pickle.dumps(doc)).value == doc.value
+
+
+def test_changing_the_value_does_not_change_the_document():
+    doc = parse("a = 1\n\n[t]\nx = 1\n")
+    value = doc.value
+    value["a"] = 99
+    value["t"]["x"] = 42
+
+    assert doc.value == {"a": 1, "t": {"x": 1}}
+    assert doc == {"a": 1, "t": {"x": 1}}
+    assert doc["t"] == {"x": 1}
+    assert doc.value is not doc.value
+
+
+def test_changing_an_array_of_tables_in_the_value_does_not_change_the_document():
+    doc = parse("[[pkg]]\nname = 'a'\n\n[[pkg]]\nname = 'b'\n")
+    expected = {"pkg": [{"name": "a"}, {"name": "b"}]}
+    doc.value["pkg"].append("junk")
+    doc.value["pkg"].pop(0)
+
+    assert doc.value == expected
+    assert doc == expected
+    assert doc.as_string() == "[[pkg]]\nname = 'a'\n\n[[pkg]]\nname = 'b'\n"
+
+
+def test_out_of_order_table_proxies_are_reused_until_changed():
+    content = """\
+[a.a]
+key = "value"
+
+[b]
+
+[a.b]
+key = "other"
+"""
+    doc = parse(content)
+    proxy = doc["a"]
+
+    assert doc["a"] is proxy
+
+    doc["a"]["c"] = 1
+
+    assert doc["a"] is not proxy
+    assert doc["a"] == {"a": {"key": "value"}, "b": {"key": "other"}, "c": 1}
+
+    proxy = doc["a"]
+    doc.body[0][1]["a"]["key"] = "new_value"
+
+    assert doc["a"]["a"]["key"] == "new_value"
+
+    del doc["b"]
+
+    assert doc["a"] == {"a": {"key": "new_value"}, "b": {"key": "other"}, "c": 1}
+
+
+def test_out_of_order_table_proxies_are_dropped_with_their_key():
+    content = """\
+[a.a]
+key = "value"
+
+[b]
+
+[a.b]
+key = "other"
+"""
+    doc = parse(content)
+    doc["a"]
+    del doc["a"]
+
+    assert "a" not in doc._proxies
+
+    doc = parse(content)
+    doc["a"]
+    doc["a"] = {"c": 1}
+
+    assert "a" not in doc._proxies
+    assert doc["a"] == {"c": 1}
+
+
+def test_string_is_updated_after_nested_changes():
+    content = """\
+[a.b]
+c = 1
+l = [1, 2]
+
+[[d]]
+e = 1
+
+[[d]]
+e = 2
+"""
+    doc = parse(content)
+
+    assert doc.as_string() == content
+
+    doc["a"]["b"]["c"] = 2
+    doc["a"]["b"]["l"].append(3)
+    doc["d"][1]["e"] = 3
+
+    assert (
+        doc.as_string()
+        == """\
+[a.b]
+c = 2
+l = [1, 2, 3]
+
+[[d]]
+e = 1
+
+[[d]]
+e = 3
+"""
+    )
+
+    doc["a"]["b"].value.item("c").trivia.comment = "# changed"
+    doc["d"][0].trivia.indent = "  "
+
+    expected = """\
+[a.b]
+c = 2# changed
+l = [1, 2, 3]
+
+  [[d]]
+e = 1
+
+[[d]]
+e = 3
+"""
+    assert doc.as_string() == expected
+
+    fp = io.StringIO()
+    doc.write_to(fp)
+
+    assert fp.getvalue() == expected
+
+
+def test_unchanged_document_is_output_as_parsed():
+    content = """\
+# Comment
+a = 1
+
+[b]
+c = 2
+
+[[d]]
+e = 1
+
+[[d]]
+e = 2
+"""
+    doc = parse(content)
+
+    assert doc.as_string() is content
+
+    fp = io.StringIO()
+    doc.write_to(fp)
+
+    assert fp.getvalue() == content
+
+    doc["d"][1]["e"] = 3
+    doc["f"] = 4
+
+    expected = """\
+# Comment
+a = 1
+f = 4
+
+[b]
+c = 2
+
+[[d]]
+e = 1
+
+[[d]]
+e = 3
+"""
+    assert doc.as_string() == expected
+
+    fp = io.StringIO()
+    doc.write_to(fp)
+
+    assert fp.getvalue() == expected
+
+
+def test_unchanged_entries_keep_their_span_of_the_source():
+    content = "a = 1\n\n[b]\nc = 2\n\n[[d]]\ne = 1\n\n[[d]]\ne = 2\n"
+    doc = parse(content)
+    doc["a"] = 3
+    caches = [doc._render_cache, doc["d"]._render_cache]
+
+    assert all(cache.source is content for cache in caches)
+    assert caches[0].entries[1:3] == [(6, 7), (7, 18)]
+    assert caches[1].entries == [(18, 31), (31, len(content))]
+    assert doc.as_string() == content.replace("a = 1", "a = 3")
+
+
+def test_copy_reuses_the_rendered_text_until_either_changes():
+    content = """\
+a = 1
+
+[b]
+c = 2
+"""
+    doc = parse(content)
+    doc["a"] = 3
+    assert doc.as_string() == content.replace("a = 1", "a = 3")
+
+    copied = doc.copy()
+    copied["d"] = 4
+
+    assert (
+        copied.as_string()
+        == """\
+a = 3
+d = 4
+
+[b]
+c = 2
+"""
+    )
+    assert doc.as_string() == content.replace("a = 1", "a = 3")
+    assert copied == {"a": 3, "d": 4, "b": {"c": 2}}
+    assert doc == {"a": 3, "b": {"c": 2}}
+    assert copy.copy(parse(content)).as_string() == content
+
+
+def test_super_tables_defined_in_many_places_are_merged():
+    content = "".join(f"[a.b{i}]\nx = {i}\n[c{i}]\n[a.b{i}.d]\n" for i in range(50))
+    doc = parse(content)
+
+    assert doc.as_string() == content
+    assert doc["a"]["b49"] == {"x": 49, "d": {}}
+    assert len(doc["a"]) == 50
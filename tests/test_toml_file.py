@@ -1,5 +1,7 @@
 import os
 
+import pytest
+
 from atoml.toml_document import TOMLDocument
 from atoml.toml_file import TOMLFile
 
@@ -22,3 +24,49 @@ def test_toml_file(example):
     finally:
         with open(toml_file, "w", encoding="utf-8") as f:
             assert f.write(original_content)
+
+
+class BrokenDocument(TOMLDocument):
+    def write_to(self, fp):
+        fp.write("a = ")
+
+        raise RuntimeError("rendering failed")
+
+
+class Document:
+    def as_string(self):
+        return "a = 1\n"
+
+
+def test_toml_file_is_left_untouched_if_rendering_fails(tmp_path):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text("a = 1\n", encoding="utf-8")
+    os.chmod(toml_file, 0o640)
+
+    with pytest.raises(RuntimeError):
+        TOMLFile(str(toml_file)).write(BrokenDocument())
+
+    assert toml_file.read_text(encoding="utf-8") == "a = 1\n"
+    assert os.listdir(tmp_path) == ["pyproject.toml"]
+
+    doc = TOMLFile(str(toml_file)).read()
+    doc["a"] = 2
+    TOMLFile(str(toml_file)).write(doc)
+
+    assert toml_file.read_text(encoding="utf-8") == "a = 2\n"
+    assert os.stat(toml_file).st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/status"), reason="the umask cannot be read"
+)
+def test_new_toml_files_get_the_permissions_of_new_files(tmp_path):
+    expected = tmp_path / "expected.toml"
+    expected.touch()
+    toml_file = tmp_path / "pyproject.toml"
+
+    # Objects that can only be rendered as a whole are written too
+    TOMLFile(str(toml_file)).write(Document())
+
+    assert toml_file.read_text(encoding="utf-8") == "a = 1\n"
+    assert os.stat(toml_file).st_mode == os.stat(expected).st_mode
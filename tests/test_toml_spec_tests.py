@@ -102,11 +102,25 @@ def test_valid_decode(test):
 
     assert toml_val == yaml_val
     assert toml_val.as_string() == toml_content
+    assert parse(toml_content, preserve=False) == yaml_val
+
+    lazy_val = parse(toml_content, lazy=True)
+    assert lazy_val == yaml_val
+    assert lazy_val.as_string() == toml_content
 
 
 @pytest.mark.parametrize("test", ERROR_TESTS)
 def test_invalid_decode(test):
     toml_file = os.path.join(SPEC_TEST_DIR, "errors", test + ".toml")
+    with open(toml_file, encoding="utf-8") as f:
+        toml_content = f.read()
+
+    with pytest.raises(ATOMLError):
+        parse(toml_content)
+
+    with pytest.raises(ATOMLError):
+        parse(toml_content, preserve=False)
+
     with pytest.raises(ATOMLError):
-        with open(toml_file, encoding="utf-8") as f:
-            parse(f.read())
+        # Lazily parsed values raise their errors when they are read
+        parse(toml_content, lazy=True).value
@@ -45,8 +45,20 @@ def test_valid_decode(valid_case):
 
     assert toml_val == json_val
     assert toml_val.as_string() == valid_case["toml"]
+    assert parse(valid_case["toml"], preserve=False) == json_val
+
+    lazy_val = parse(valid_case["toml"], lazy=True)
+    assert lazy_val == json_val
+    assert lazy_val.as_string() == valid_case["toml"]
 
 
 def test_invalid_decode(invalid_decode_case):
     with pytest.raises(ATOMLError):
         parse(invalid_decode_case["toml"])
+
+    with pytest.raises(ATOMLError):
+        parse(invalid_decode_case["toml"], preserve=False)
+
+    with pytest.raises(ATOMLError):
+        # Lazily parsed values raise their errors when they are read
+        parse(invalid_decode_case["toml"], lazy=True).value